@@ -2,10 +2,11 @@
 """
 ResearchHub AI  –  FastAPI Application Entry Point
 ===================================================
-Starts the server, initialises the database, configures CORS,
-and registers all routers.
+Starts the server, configures CORS, registers all routers and warms
+the embedding model. The schema is managed by Alembic, not at startup.
 
 Run:
+    alembic upgrade head        # once per deploy, before starting workers
     uvicorn main:app --reload --host 0.0.0.0 --port 8000
 
 Interactive API docs:
@@ -17,14 +18,24 @@ import os
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+
+try:
+    import orjson  # noqa: F401 – ORJSONResponse needs it at render time
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:  # optional dependency – stdlib json
+    from fastapi.responses import JSONResponse as DefaultResponse
 
-from models.database import init_db
 from routers.auth        import router as auth_router
 from routers.chat        import router as chat_router
 from routers.dashboard   import router as dashboard_router
 from routers.papers      import router as papers_router
 from routers.upload      import router as upload_router
 from routers.workspaces  import router as workspaces_router
+from utils.arxiv_client  import aclose_client as close_arxiv_client
+from utils.embed_queue   import start as start_embed_queue
+from utils.pubmed_client import aclose_client as close_pubmed_client
+from utils.vector_db     import warm_model
 
 load_dotenv()
 
@@ -35,6 +46,8 @@ app = FastAPI(
     version     = "2.0.0",
     docs_url    = "/docs",
     redoc_url   = "/redoc",
+    # Endpoint bodies are dumped with orjson when it is installed
+    default_response_class = DefaultResponse,
 )
 
 # ── CORS  (allows Streamlit frontend on port 8501) ────────────
@@ -49,10 +62,30 @@ app.add_middleware(
     allow_headers     = ["*"],
 )
 
-# ── Database init ─────────────────────────────────────────────
+# ── Compression  (paper lists / dashboard JSON shrink 5-10×) ──
+class _GZipExceptStreams(GZipMiddleware):
+    """GZip buffers chunks, which would stall SSE – pass /stream routes through."""
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].endswith("/stream"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+app.add_middleware(_GZipExceptStreams, minimum_size=1024, compresslevel=5)
+
+# ── Warm-up ───────────────────────────────────────────────────
 @app.on_event("startup")
 def startup():
-    init_db()
+    # Load MiniLM before accepting traffic so the first chat/search isn't cold
+    warm_model()
+    # Picks up papers left without a vector by a crash or a failed batch
+    start_embed_queue()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await close_arxiv_client()
+    await close_pubmed_client()
 
 
 # ── Routers ───────────────────────────────────────────────────
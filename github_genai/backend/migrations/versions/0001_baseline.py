@@ -0,0 +1,121 @@
+"""Baseline schema (as created by init_db before migrations existed)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-14
+
+Databases that were bootstrapped with `init_db()` should be stamped
+rather than upgraded:  alembic stamp 0001
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision      = "0001"
+down_revision = None
+branch_labels = None
+depends_on    = None
+
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id",              sa.Integer(), primary_key=True),
+        sa.Column("email",           sa.String(255), nullable=False),
+        sa.Column("hashed_password", sa.String(255), nullable=False),
+        sa.Column("full_name",       sa.String(255)),
+        sa.Column("plan",            sa.String(50)),
+        sa.Column("is_active",       sa.Boolean()),
+        sa.Column("created_at",      sa.DateTime()),
+    )
+    op.create_index("ix_users_id",    "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "workspaces",
+        sa.Column("id",          sa.Integer(), primary_key=True),
+        sa.Column("name",        sa.String(255), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("icon",        sa.String(10)),
+        sa.Column("color",       sa.String(20)),
+        sa.Column("owner_id",    sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("created_at",  sa.DateTime()),
+        sa.Column("updated_at",  sa.DateTime()),
+    )
+    op.create_index("ix_workspaces_id", "workspaces", ["id"])
+
+    op.create_table(
+        "papers",
+        sa.Column("id",             sa.Integer(), primary_key=True),
+        sa.Column("external_id",    sa.String(255)),
+        sa.Column("source",         sa.String(50)),
+        sa.Column("title",          sa.Text(), nullable=False),
+        sa.Column("authors",        sa.Text()),
+        sa.Column("abstract",       sa.Text()),
+        sa.Column("published_date", sa.String(50)),
+        sa.Column("url",            sa.Text()),
+        sa.Column("pdf_url",        sa.Text()),
+        sa.Column("journal",        sa.String(255)),
+        sa.Column("venue",          sa.String(255)),
+        sa.Column("doi",            sa.String(255)),
+        sa.Column("citations",      sa.Integer()),
+        sa.Column("tags",           sa.Text()),
+        sa.Column("full_text",      sa.Text()),
+        sa.Column("ai_summary",     sa.Text()),
+        sa.Column("owner_id",       sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("created_at",     sa.DateTime()),
+    )
+    op.create_index("ix_papers_id", "papers", ["id"])
+
+    op.create_table(
+        "workspace_papers",
+        sa.Column("id",           sa.Integer(), primary_key=True),
+        sa.Column("workspace_id", sa.Integer(), sa.ForeignKey("workspaces.id"), nullable=False),
+        sa.Column("paper_id",     sa.Integer(), sa.ForeignKey("papers.id"),     nullable=False),
+        sa.Column("notes",        sa.Text()),
+        sa.Column("added_at",     sa.DateTime()),
+    )
+    op.create_index("ix_workspace_papers_id", "workspace_papers", ["id"])
+
+    op.create_table(
+        "vector_embeddings",
+        sa.Column("id",         sa.Integer(), primary_key=True),
+        sa.Column("paper_id",   sa.Integer(), sa.ForeignKey("papers.id"), nullable=False, unique=True),
+        sa.Column("vector",     sa.Text(), nullable=False),
+        sa.Column("model_name", sa.String(100)),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    op.create_index("ix_vector_embeddings_id", "vector_embeddings", ["id"])
+
+    op.create_table(
+        "conversation_history",
+        sa.Column("id",           sa.Integer(), primary_key=True),
+        sa.Column("workspace_id", sa.Integer(), sa.ForeignKey("workspaces.id"), nullable=False),
+        sa.Column("role",         sa.String(20), nullable=False),
+        sa.Column("content",      sa.Text(), nullable=False),
+        sa.Column("created_at",   sa.DateTime()),
+    )
+    op.create_index("ix_conversation_history_id", "conversation_history", ["id"])
+
+    op.create_table(
+        "documents",
+        sa.Column("id",           sa.Integer(), primary_key=True),
+        sa.Column("name",         sa.String(255), nullable=False),
+        sa.Column("doc_type",     sa.String(50)),
+        sa.Column("content",      sa.Text()),
+        sa.Column("size_bytes",   sa.Integer()),
+        sa.Column("page_count",   sa.Integer()),
+        sa.Column("workspace_id", sa.Integer(), sa.ForeignKey("workspaces.id"), nullable=True),
+        sa.Column("owner_id",     sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("created_at",   sa.DateTime()),
+    )
+    op.create_index("ix_documents_id", "documents", ["id"])
+
+
+def downgrade():
+    for table in (
+        "documents", "conversation_history", "vector_embeddings",
+        "workspace_papers", "papers", "workspaces", "users",
+    ):
+        op.drop_table(table)
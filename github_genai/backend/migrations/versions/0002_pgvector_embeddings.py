@@ -0,0 +1,37 @@
+"""Store embeddings as pgvector vector(384) with an HNSW cosine index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision      = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on    = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    # Existing rows hold "f1,f2,…" CSV – wrap in brackets to get the vector literal
+    op.execute(
+        "ALTER TABLE vector_embeddings "
+        "ALTER COLUMN vector TYPE vector(384) USING ('[' || vector || ']')::vector"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS vector_embeddings_hnsw_idx "
+        "ON vector_embeddings USING hnsw (vector vector_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade():
+    op.drop_index("vector_embeddings_hnsw_idx", table_name="vector_embeddings")
+    op.execute(
+        "ALTER TABLE vector_embeddings "
+        "ALTER COLUMN vector TYPE text USING trim(both '[]' from vector::text)"
+    )
@@ -0,0 +1,37 @@
+"""Indexes for the owner / workspace / created_at filter paths
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision      = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on    = None
+
+
+INDEXES = [
+    ("ix_papers_owner_created", "papers",               "owner_id, created_at DESC"),
+    ("ix_wp_workspace",         "workspace_papers",     "workspace_id"),
+    ("ix_wp_paper",             "workspace_papers",     "paper_id"),
+    ("ix_conv_ws_created",      "conversation_history", "workspace_id, created_at"),
+    ("ix_conv_role_created",    "conversation_history", "role, created_at"),
+]
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, cols in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({cols})")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _, _ in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,42 @@
+"""Store embeddings as fp16 halfvec(384)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision      = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on    = None
+
+
+def upgrade():
+    # The vector_cosine_ops index cannot survive the type change
+    op.drop_index("vector_embeddings_hnsw_idx", table_name="vector_embeddings")
+    op.execute(
+        "ALTER TABLE vector_embeddings "
+        "ALTER COLUMN vector TYPE halfvec(384) USING vector::halfvec(384)"
+    )
+    op.execute(
+        "CREATE INDEX vector_embeddings_hnsw_idx "
+        "ON vector_embeddings USING hnsw (vector halfvec_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade():
+    op.drop_index("vector_embeddings_hnsw_idx", table_name="vector_embeddings")
+    op.execute(
+        "ALTER TABLE vector_embeddings "
+        "ALTER COLUMN vector TYPE vector(384) USING vector::vector(384)"
+    )
+    op.execute(
+        "CREATE INDEX vector_embeddings_hnsw_idx "
+        "ON vector_embeddings USING hnsw (vector vector_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
@@ -0,0 +1,42 @@
+"""ON DELETE CASCADE for child rows of papers and workspaces
+
+Lets the ORM use passive_deletes instead of loading every link,
+embedding and chat turn just to delete them.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision      = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on    = None
+
+
+FOREIGN_KEYS = [
+    # (table, column, referred table)
+    ("workspace_papers",     "workspace_id", "workspaces"),
+    ("workspace_papers",     "paper_id",     "papers"),
+    ("vector_embeddings",    "paper_id",     "papers"),
+    ("conversation_history", "workspace_id", "workspaces"),
+]
+
+
+def _recreate(ondelete):
+    for table, column, referred in FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(name, table, referred, [column], ["id"], ondelete=ondelete)
+
+
+def upgrade():
+    _recreate("CASCADE")
+
+
+def downgrade():
+    _recreate(None)
@@ -0,0 +1,36 @@
+"""Store papers.authors / papers.tags as JSONB
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision      = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on    = None
+
+
+def upgrade():
+    # Both columns only ever held json.dumps() output (or NULL)
+    op.execute(
+        "ALTER TABLE papers "
+        "ALTER COLUMN authors TYPE jsonb USING authors::jsonb, "
+        "ALTER COLUMN tags    TYPE jsonb USING tags::jsonb"
+    )
+    op.execute(
+        "CREATE INDEX ix_papers_tags_gin ON papers USING gin (tags jsonb_path_ops)"
+    )
+
+
+def downgrade():
+    op.drop_index("ix_papers_tags_gin", table_name="papers")
+    op.execute(
+        "ALTER TABLE papers "
+        "ALTER COLUMN authors TYPE text USING authors::text, "
+        "ALTER COLUMN tags    TYPE text USING tags::text"
+    )
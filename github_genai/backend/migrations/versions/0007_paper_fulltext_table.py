@@ -0,0 +1,37 @@
+"""Move papers.full_text into a 1:1 paper_fulltext table
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision      = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on    = None
+
+
+def upgrade():
+    op.create_table(
+        "paper_fulltext",
+        sa.Column("paper_id", sa.Integer(), sa.ForeignKey("papers.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("text",     sa.Text(),    nullable=False),
+    )
+    op.execute(
+        "INSERT INTO paper_fulltext (paper_id, text) "
+        "SELECT id, full_text FROM papers WHERE full_text IS NOT NULL AND full_text <> ''"
+    )
+    op.drop_column("papers", "full_text")
+
+
+def downgrade():
+    op.add_column("papers", sa.Column("full_text", sa.Text()))
+    op.execute(
+        "UPDATE papers SET full_text = f.text "
+        "FROM paper_fulltext f WHERE f.paper_id = papers.id"
+    )
+    op.drop_table("paper_fulltext")
@@ -0,0 +1,49 @@
+"""Indexes for Doc Space / workspace listings; unique workspace↔paper link
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision      = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on    = None
+
+
+def upgrade():
+    # Racing "add to workspace" calls could have left duplicate links
+    op.execute(
+        "DELETE FROM workspace_papers a USING workspace_papers b "
+        "WHERE a.workspace_id = b.workspace_id AND a.paper_id = b.paper_id AND a.id > b.id"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_documents_owner_created "
+            "ON documents (owner_id, created_at DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_workspaces_owner "
+            "ON workspaces (owner_id)"
+        )
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_wp_workspace_paper "
+            "ON workspace_papers (workspace_id, paper_id)"
+        )
+        # Prefix of uq_wp_workspace_paper – now redundant
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_wp_workspace")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_wp_workspace "
+            "ON workspace_papers (workspace_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_wp_workspace_paper")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_workspaces_owner")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_documents_owner_created")
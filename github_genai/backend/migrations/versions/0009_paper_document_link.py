@@ -0,0 +1,30 @@
+"""Link uploaded papers to their source document
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-14
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision      = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on    = None
+
+
+def upgrade():
+    op.add_column("papers", sa.Column("document_id", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        "papers_document_id_fkey", "papers", "documents",
+        ["document_id"], ["id"], ondelete="SET NULL",
+    )
+    op.create_index("ix_papers_document", "papers", ["document_id"])
+
+
+def downgrade():
+    op.drop_index("ix_papers_document", table_name="papers")
+    op.drop_constraint("papers_document_id_fkey", "papers", type_="foreignkey")
+    op.drop_column("papers", "document_id")
@@ -4,37 +4,83 @@ Pydantic v2 schemas – one schema per API request/response pair.
 Structured to exactly match what the Streamlit frontend sends and expects.
 """
 
-from __future__ import annotations
+import re
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, EmailStr, field_validator
+from typing import Annotated, ClassVar, List, Literal, Optional, Tuple
+from pydantic import (
+    AfterValidator, BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter, field_validator,
+)
+
+
+_MISSING = object()
+
+PaperSource = Literal["arxiv", "pubmed"]
+ToolType    = Literal["summarize", "insights", "literature_review"]
+
+class RowOut(BaseModel):
+    """
+    Base for *Out schemas read from ORM rows. The rows come from our own
+    tables, so from_row() copies the columns with model_construct() and
+    skips per-field validation; FastAPI then passes the instance through.
+    Instances are frozen – build a new one rather than assigning fields.
+    """
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+    _row_fields: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._row_fields = tuple(cls.model_fields)   # fixed once the class is built
+
+    @classmethod
+    def from_row(cls, row, **values):
+        for name in cls._row_fields:
+            if name not in values:
+                value = getattr(row, name, _MISSING)
+                if value is not _MISSING:
+                    values[name] = value
+        return cls.model_construct(**values)
 
 
 # ═════════════════════════════════════════════════════════════
 # AUTH
 # ═════════════════════════════════════════════════════════════
 
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+def _email(value: str) -> str:
+    """
+    Shape check in place of EmailStr (no email-validator import). The
+    domain is lower-cased as EmailStr did, so existing logins still match.
+    """
+    if not _EMAIL_RE.fullmatch(value):
+        raise ValueError("value is not a valid email address")
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+Email = Annotated[str, AfterValidator(_email)]
+
 class UserCreate(BaseModel):
-    email:     EmailStr
+    email:     Email
     password:  str
     full_name: Optional[str] = None
 
 class UserLogin(BaseModel):
-    email:    EmailStr
+    email:    Email
     password: str
 
-class UserOut(BaseModel):
+class UserOut(RowOut):
     id:         int
     email:      str
     full_name:  Optional[str]
     plan:       str
     is_active:  bool
     created_at: datetime
-    model_config = {"from_attributes": True}
 
 class Token(BaseModel):
     access_token: str
-    token_type:   str = "bearer"
+    token_type:   Literal["bearer"] = "bearer"
 
 class TokenData(BaseModel):
     user_id: Optional[int] = None
@@ -44,13 +90,16 @@ class TokenData(BaseModel):
 # WORKSPACE
 # ═════════════════════════════════════════════════════════════
 
+# Checked by pydantic-core's regex engine; the value ends up in inline CSS
+HexColor = Annotated[str, StringConstraints(pattern=r"^#[0-9a-fA-F]{6}$")]
+
 class WorkspaceCreate(BaseModel):
     name:        str
     description: Optional[str] = None
     icon:        Optional[str] = "📁"
-    color:       Optional[str] = "#6c63ff"
+    color:       Optional[HexColor] = "#6c63ff"
 
-class WorkspaceOut(BaseModel):
+class WorkspaceOut(RowOut):
     id:          int
     name:        str
     description: Optional[str]
@@ -59,13 +108,12 @@ class WorkspaceOut(BaseModel):
     owner_id:    int
     created_at:  datetime
     paper_count: int = 0
-    model_config = {"from_attributes": True}
 
 class WorkspaceUpdate(BaseModel):
     name:        Optional[str] = None
     description: Optional[str] = None
     icon:        Optional[str] = None
-    color:       Optional[str] = None
+    color:       Optional[HexColor] = None
 
 
 # ═════════════════════════════════════════════════════════════
@@ -75,7 +123,7 @@ class WorkspaceUpdate(BaseModel):
 class PaperSearchResult(BaseModel):
     """Returned by arXiv / PubMed search – not yet stored in DB."""
     external_id:    str
-    source:         str
+    source:         PaperSource
     title:          str
     authors:        List[str]
     abstract:       str
@@ -86,13 +134,13 @@ class PaperSearchResult(BaseModel):
     venue:          Optional[str] = None
     doi:            Optional[str] = None
     citations:      int = 0
-    tags:           List[str] = []
+    tags:           List[str] = Field(default_factory=list)
 
 class PaperImport(BaseModel):
     external_id:    Optional[str] = None
-    source:         Optional[str] = "arxiv"
+    source:         Optional[PaperSource] = "arxiv"
     title:          str
-    authors:        Optional[List[str]] = []
+    authors:        List[str] = Field(default_factory=list)
     abstract:       Optional[str] = None
     published_date: Optional[str] = None
     url:            Optional[str] = None
@@ -100,16 +148,16 @@ class PaperImport(BaseModel):
     journal:        Optional[str] = None
     venue:          Optional[str] = None
     doi:            Optional[str] = None
-    citations:      Optional[int] = 0
-    tags:           Optional[List[str]] = []
+    citations:      int = 0
+    tags:           List[str] = Field(default_factory=list)
     workspace_id:   Optional[int] = None
 
-class PaperOut(BaseModel):
+class PaperOut(RowOut):
     id:             int
     external_id:    Optional[str]
     source:         Optional[str]
     title:          str
-    authors:        Optional[str]   # raw JSON string
+    authors:        Optional[List[str]]
     abstract:       Optional[str]
     published_date: Optional[str]
     url:            Optional[str]
@@ -118,16 +166,32 @@ class PaperOut(BaseModel):
     venue:          Optional[str]
     doi:            Optional[str]
     citations:      int
-    tags:           Optional[str]   # raw JSON string
+    tags:           Optional[List[str]]
     ai_summary:     Optional[str]
     owner_id:       int
     created_at:     datetime
-    model_config = {"from_attributes": True}
+
+class PaperFullOut(PaperOut):
+    full_text:      Optional[str]
 
 class SemanticSearchResult(BaseModel):
     paper:      PaperOut
     similarity: float
 
+class PaperListColumns(BaseModel):
+    """
+    Library table view – one list per column, index i across the lists is
+    paper i. Skips the repeated keys of a List[PaperOut] payload.
+    """
+    ids:             List[int]
+    sources:         List[Optional[str]]
+    titles:          List[str]
+    authors:         List[Optional[List[str]]]
+    published_dates: List[Optional[str]]
+    venues:          List[Optional[str]]
+    citations:       List[int]
+    tags:            List[Optional[List[str]]]
+
 
 # ═════════════════════════════════════════════════════════════
 # CHAT / AI
@@ -142,13 +206,12 @@ class ChatResponse(BaseModel):
     workspace_id: int
     model:        str
 
-class ConversationOut(BaseModel):
+class ConversationOut(RowOut):
     id:           int
     workspace_id: int
-    role:         str
+    role:         Literal["user", "assistant"]
     content:      str
     created_at:   datetime
-    model_config = {"from_attributes": True}
 
 
 # ═════════════════════════════════════════════════════════════
@@ -156,11 +219,11 @@ class ConversationOut(BaseModel):
 # ═════════════════════════════════════════════════════════════
 
 class AIToolRequest(BaseModel):
-    paper_ids:    List[int]
-    tool_type:    str    # summarize | insights | literature_review
+    paper_ids:    Tuple[int, ...]
+    tool_type:    ToolType
 
 class AIToolResponse(BaseModel):
-    tool_type: str
+    tool_type: ToolType
     result:    str
     model:     str
 
@@ -169,7 +232,7 @@ class AIToolResponse(BaseModel):
 # UPLOAD / DOC SPACE
 # ═════════════════════════════════════════════════════════════
 
-class DocumentOut(BaseModel):
+class DocumentOut(RowOut):
     id:           int
     name:         str
     doc_type:     str
@@ -177,7 +240,6 @@ class DocumentOut(BaseModel):
     page_count:   int
     workspace_id: Optional[int]
     created_at:   datetime
-    model_config = {"from_attributes": True}
 
 class NoteCreate(BaseModel):
     name:         str
@@ -185,12 +247,14 @@ class NoteCreate(BaseModel):
     workspace_id: Optional[int] = None
 
 class UploadResponse(BaseModel):
-    document_id:  int
-    name:         str
-    pages:        int
-    size_bytes:   int
-    ai_summary:   Optional[str]
-    workspace:    Optional[str]
+    document_id:    int
+    paper_id:       int
+    name:           str
+    pages:          int
+    size_bytes:     int
+    ai_summary:     Optional[str]
+    summary_status: str   # pending | none – poll GET /upload/documents/{id}
+    workspace:      Optional[str]
 
 
 # ═════════════════════════════════════════════════════════════
@@ -204,3 +268,27 @@ class DashboardStats(BaseModel):
     total_citations:  int
     recent_papers:    List[PaperOut]
     active_workspaces: List[WorkspaceOut]
+
+class DashboardStatsLean(BaseModel):
+    """DashboardStats with ids in place of the embedded models (?ids_only=true)."""
+    total_papers:         int
+    total_workspaces:     int
+    ai_queries_today:     int
+    total_citations:      int
+    recent_paper_ids:     List[int]
+    active_workspace_ids: List[int]
+
+
+# ═════════════════════════════════════════════════════════════
+# LIST ADAPTERS
+# ═════════════════════════════════════════════════════════════
+# Built once at import. List endpoints dump their rows straight to JSON
+# bytes with these instead of going through FastAPI's per-response
+# validate → dict → encode round trip.
+
+PaperSearchResultListAdapter    = TypeAdapter(List[PaperSearchResult])
+PaperOutListAdapter             = TypeAdapter(List[PaperOut])
+SemanticSearchResultListAdapter = TypeAdapter(List[SemanticSearchResult])
+WorkspaceOutListAdapter         = TypeAdapter(List[WorkspaceOut])
+ConversationOutListAdapter      = TypeAdapter(List[ConversationOut])
+DocumentOutListAdapter          = TypeAdapter(List[DocumentOut])
@@ -13,7 +13,7 @@ from sqlalchemy.orm import Session
 from models.database import User, get_db
 from models.schemas  import Token, UserCreate, UserLogin, UserOut
 from utils.security  import (
-    create_access_token, get_current_user, hash_password, verify_password,
+    create_access_token, forget_user, get_current_user, hash_password, verify_and_rehash,
 )
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -41,7 +41,7 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     db.add(user)
     db.commit()
     db.refresh(user)
-    return user
+    return UserOut.from_row(user)
 
 
 # ── Login ─────────────────────────────────────────────────────
@@ -52,8 +52,11 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
     The Streamlit app stores this token and sends it with every API call.
     """
     user = db.query(User).filter_by(email=credentials.email).first()
+    valid, new_hash = (
+        verify_and_rehash(credentials.password, user.hashed_password) if user else (False, None)
+    )
 
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password.",
@@ -66,6 +69,11 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
             detail="Account is disabled. Please contact support.",
         )
 
+    # Upgrade bcrypt-era hashes to Argon2id now that we have the plaintext
+    if new_hash:
+        user.hashed_password = new_hash
+        db.commit()
+
     return Token(access_token=create_access_token(user.id))
 
 
@@ -73,7 +81,7 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
 @router.get("/me", response_model=UserOut)
 def get_me(current_user: User = Depends(get_current_user)):
     """Return the profile of the currently authenticated user."""
-    return current_user
+    return UserOut.from_row(current_user)
 
 
 # ── Update profile ────────────────────────────────────────────
@@ -91,5 +99,6 @@ def update_me(
         current_user.hashed_password = hash_password(updates["password"])
 
     db.commit()
+    forget_user(current_user.id)
     db.refresh(current_user)
-    return current_user
+    return UserOut.from_row(current_user)
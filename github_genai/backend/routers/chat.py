@@ -3,6 +3,7 @@
 Chat endpoints – powers the AI Assistant page.
 
 POST /chat/message              – send message, get AI response
+POST /chat/message/stream       – same, streamed as Server-Sent Events
 GET  /chat/{workspace_id}/history – fetch conversation history
 DELETE /chat/{workspace_id}/history – clear conversation history
 """
@@ -12,15 +13,18 @@ import logging
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy     import insert
 from sqlalchemy.orm import Session
 
 from models.database import (
-    ConversationHistory, Paper, User, Workspace, WorkspacePaper, get_db,
+    ConversationHistory, Paper, SessionLocal, User, WorkspacePaper, get_db,
 )
-from models.schemas  import ChatMessage, ChatResponse, ConversationOut
-from utils.groq_client  import chat_with_context
-from utils.security     import get_current_user
-from utils.vector_db    import workspace_semantic_search
+from models.schemas  import ChatMessage, ChatResponse, ConversationOut, ConversationOutListAdapter
+from utils.cache        import bust_dashboard
+from utils.groq_client  import chat_with_context, stream_chat_with_context
+from utils.security     import get_current_user, owns_workspace
+from utils.vector_db    import embed_text_async, workspace_semantic_search
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/chat", tags=["AI Chat"])
@@ -38,49 +42,14 @@ def send_message(
 
     Flow:
     1. Verify user owns the workspace
-    2. Retrieve semantically relevant papers as context
-    3. Fetch conversation history for multi-turn awareness
+    2. Fetch conversation history for multi-turn awareness
+    3. Retrieve semantically relevant papers as context
+       (the query is embedded on a worker thread during steps 1–2)
     4. Call Groq Llama 3.3 70B with full context
     5. Persist both turns to conversation_history
     6. Return the AI response
     """
-    # 1. Verify workspace ownership
-    ws = db.query(Workspace).filter_by(
-        id=msg.workspace_id, owner_id=current_user.id
-    ).first()
-    if not ws:
-        raise HTTPException(status_code=404, detail="Workspace not found.")
-
-    # 2. Get relevant papers via semantic search
-    relevant = workspace_semantic_search(
-        db,
-        query        = msg.content,
-        workspace_id = msg.workspace_id,
-        owner_id     = current_user.id,
-        top_k        = 5,
-    )
-
-    # Fall back to all workspace papers if no embeddings yet
-    if not relevant:
-        all_papers = (
-            db.query(Paper)
-            .join(WorkspacePaper, WorkspacePaper.paper_id == Paper.id)
-            .filter(WorkspacePaper.workspace_id == msg.workspace_id)
-            .all()
-        )
-        paper_dicts = [_paper_to_dict(p) for p in all_papers]
-    else:
-        paper_dicts = [_paper_to_dict(p) for p, _ in relevant]
-
-    # 3. Conversation history (last 10 turns)
-    history_rows = (
-        db.query(ConversationHistory)
-        .filter_by(workspace_id=msg.workspace_id)
-        .order_by(ConversationHistory.created_at.asc())
-        .limit(20)
-        .all()
-    )
-    history = [{"role": row.role, "content": row.content} for row in history_rows]
+    paper_dicts, history = _chat_context(db, msg, current_user.id)
 
     # 4. Call Groq
     try:
@@ -93,17 +62,8 @@ def send_message(
         raise HTTPException(status_code=502, detail=str(e))
 
     # 5. Persist both turns
-    db.add(ConversationHistory(
-        workspace_id = msg.workspace_id,
-        role         = "user",
-        content      = msg.content,
-    ))
-    db.add(ConversationHistory(
-        workspace_id = msg.workspace_id,
-        role         = "assistant",
-        content      = ai_response,
-    ))
-    db.commit()
+    _save_turns(db, msg, ai_response)
+    bust_dashboard(current_user.id)
 
     return ChatResponse(
         response     = ai_response,
@@ -112,6 +72,54 @@ def send_message(
     )
 
 
+# ── Send message (streaming) ──────────────────────────────────
+@router.post("/message/stream")
+def stream_message(
+    msg:          ChatMessage,
+    db:           Session = Depends(get_db),
+    current_user: User    = Depends(get_current_user),
+):
+    """
+    Same flow as /chat/message, but the answer is streamed back as
+    Server-Sent Events while Groq generates it:
+
+        data: "<json-encoded text delta>"     (repeated)
+        event: done                           (after both turns are saved)
+        event: error                          (if generation fails mid-way)
+    """
+    paper_dicts, history = _chat_context(db, msg, current_user.id)
+
+    try:
+        deltas = stream_chat_with_context(
+            user_message          = msg.content,
+            workspace_papers      = paper_dicts,
+            conversation_history  = history,
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+    user_id = current_user.id
+
+    def events():
+        parts = []
+        try:
+            for delta in deltas:
+                parts.append(delta)
+                yield f"data: {json.dumps(delta)}\n\n"
+        except RuntimeError as e:
+            yield f"event: error\ndata: {json.dumps(str(e))}\n\n"
+            return
+
+        # The request-scoped session is not guaranteed to outlive the
+        # response body, so persist on a session of our own
+        with SessionLocal() as session:
+            _save_turns(session, msg, "".join(parts))
+        bust_dashboard(user_id)
+        yield "event: done\ndata: {}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 # ── Get history ───────────────────────────────────────────────
 @router.get("/{workspace_id}/history", response_model=List[ConversationOut])
 def get_history(
@@ -121,20 +129,12 @@ def get_history(
     current_user: User    = Depends(get_current_user),
 ):
     """Return the last `limit` messages for a workspace chatbot session."""
-    ws = db.query(Workspace).filter_by(
-        id=workspace_id, owner_id=current_user.id
-    ).first()
-    if not ws:
+    if not owns_workspace(db, current_user.id, workspace_id):
         raise HTTPException(status_code=404, detail="Workspace not found.")
 
-    rows = (
-        db.query(ConversationHistory)
-        .filter_by(workspace_id=workspace_id)
-        .order_by(ConversationHistory.created_at.asc())
-        .limit(limit)
-        .all()
-    )
-    return rows
+    turns = [ConversationOut.from_row(t) for t in _recent_turns(db, workspace_id, limit)]
+    body = ConversationOutListAdapter.dump_json(turns)
+    return Response(content=body, media_type="application/json")
 
 
 # ── Clear history ─────────────────────────────────────────────
@@ -145,25 +145,81 @@ def clear_history(
     current_user: User    = Depends(get_current_user),
 ):
     """Clears all conversation history for a workspace (Clear chat button)."""
-    ws = db.query(Workspace).filter_by(
-        id=workspace_id, owner_id=current_user.id
-    ).first()
-    if not ws:
+    if not owns_workspace(db, current_user.id, workspace_id):
         raise HTTPException(status_code=404, detail="Workspace not found.")
 
     db.query(ConversationHistory).filter_by(workspace_id=workspace_id).delete()
     db.commit()
+    bust_dashboard(current_user.id)
+
+
+# ── Helpers ───────────────────────────────────────────────────
+def _chat_context(db: Session, msg: ChatMessage, owner_id: int):
+    """Steps 1–3 of the chat flow: returns (paper_dicts, history)."""
+    # Embed the question on a worker thread while the DB lookups run
+    q_future = embed_text_async(msg.content)
+
+    # 1. Verify workspace ownership
+    if not owns_workspace(db, owner_id, msg.workspace_id):
+        raise HTTPException(status_code=404, detail="Workspace not found.")
+
+    # 2. Conversation history (last 10 turns)
+    history_rows = _recent_turns(db, msg.workspace_id, 20)
+    history = [{"role": row.role, "content": row.content} for row in history_rows]
+
+    # 3. Get relevant papers via semantic search
+    relevant = workspace_semantic_search(
+        db,
+        query        = msg.content,
+        workspace_id = msg.workspace_id,
+        owner_id     = owner_id,
+        top_k        = 5,
+        q_vec        = q_future.result(),
+    )
+
+    # Fall back to all workspace papers if no embeddings yet
+    if not relevant:
+        all_papers = (
+            db.query(Paper)
+            .join(WorkspacePaper, WorkspacePaper.paper_id == Paper.id)
+            .filter(WorkspacePaper.workspace_id == msg.workspace_id)
+            .all()
+        )
+        paper_dicts = [_paper_to_dict(p) for p in all_papers]
+    else:
+        paper_dicts = [_paper_to_dict(p) for p, _ in relevant]
+
+    return paper_dicts, history
+
+
+def _recent_turns(db: Session, workspace_id: int, limit: int) -> List[ConversationHistory]:
+    """
+    Newest `limit` turns in chronological order. Reading DESC lets Postgres
+    walk ix_conv_ws_created backwards and stop after `limit` rows.
+    """
+    rows = (
+        db.query(ConversationHistory)
+        .filter_by(workspace_id=workspace_id)
+        .order_by(ConversationHistory.created_at.desc(), ConversationHistory.id.desc())
+        .limit(limit)
+        .all()
+    )
+    rows.reverse()
+    return rows
+
+
+def _save_turns(db: Session, msg: ChatMessage, ai_response: str) -> None:
+    """Persist the user + assistant turns with one multi-row INSERT."""
+    db.execute(insert(ConversationHistory), [
+        {"workspace_id": msg.workspace_id, "role": "user",      "content": msg.content},
+        {"workspace_id": msg.workspace_id, "role": "assistant", "content": ai_response},
+    ])
+    db.commit()
 
 
-# ── Helper ────────────────────────────────────────────────────
 def _paper_to_dict(paper: Paper) -> dict:
-    authors = paper.authors or "[]"
-    try:
-        authors = json.loads(authors)
-    except Exception:
-        authors = [authors]
     return {
         "title":    paper.title,
-        "authors":  authors,
+        "authors":  paper.authors or [],
         "abstract": paper.abstract or "",
     }
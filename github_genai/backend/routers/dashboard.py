@@ -6,84 +6,114 @@ GET /dashboard/stats  – aggregated stats for the current user
 """
 
 from datetime import datetime, timedelta
+from typing import Union
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from models.database import (
     ConversationHistory, Paper, User, Workspace, WorkspacePaper, get_db,
 )
-from models.schemas  import DashboardStats, PaperOut, WorkspaceOut
+from models.schemas  import DashboardStats, DashboardStatsLean, PaperOut, WorkspaceOut
+from utils.cache     import DASHBOARD_TTL, cache_get, cache_set, dashboard_key
 from utils.security  import get_current_user
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
 
-@router.get("/stats", response_model=DashboardStats)
+@router.get("/stats", response_model=Union[DashboardStats, DashboardStatsLean])
 def get_stats(
+    ids_only:     bool    = Query(False, description="ids instead of paper/workspace objects"),
     db:           Session = Depends(get_db),
     current_user: User    = Depends(get_current_user),
 ):
     """
-    Returns everything the Dashboard page needs in a single request:
+    Returns everything the Dashboard page needs in a single request
+    (three queries: KPIs, recent papers, active workspaces):
     • 4 KPI cards (papers, workspaces, AI queries today, citations)
     • Recent papers (last 5)
     • Active workspaces (top 3 by paper count)
+
+    With ids_only=true the two lists carry just ids (DashboardStatsLean),
+    for clients that already hold those papers/workspaces from
+    /papers/ and /workspaces/.
+
+    Cached per user and view for DASHBOARD_TTL seconds; writes that change these
+    numbers call utils.cache.bust_dashboard.
     """
     uid = current_user.id
+    key = dashboard_key(uid, ids_only)
 
-    # KPI 1: Total papers
-    total_papers = db.query(func.count(Paper.id)).filter_by(owner_id=uid).scalar() or 0
+    cached = cache_get(key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    # KPI 2: Total workspaces
-    total_workspaces = db.query(func.count(Workspace.id)).filter_by(owner_id=uid).scalar() or 0
+    today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
 
-    # KPI 3: AI queries today
-    today_start    = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-    ai_queries_today = (
-        db.query(func.count(ConversationHistory.id))
-        .join(Workspace, ConversationHistory.workspace_id == Workspace.id)
-        .filter(
-            Workspace.owner_id == uid,
-            ConversationHistory.role == "user",
-            ConversationHistory.created_at >= today_start,
+    # KPI cards – four scalar subqueries, one round-trip
+    kpis = db.execute(
+        select(
+            select(func.count(Paper.id))
+            .where(Paper.owner_id == uid)
+            .scalar_subquery().label("total_papers"),
+            select(func.count(Workspace.id))
+            .where(Workspace.owner_id == uid)
+            .scalar_subquery().label("total_workspaces"),
+            select(func.count(ConversationHistory.id))
+            .join(Workspace, ConversationHistory.workspace_id == Workspace.id)
+            .where(
+                Workspace.owner_id == uid,
+                ConversationHistory.role == "user",
+                ConversationHistory.created_at >= today_start,
+            )
+            .scalar_subquery().label("ai_queries_today"),
+            select(func.coalesce(func.sum(Paper.citations), 0))
+            .where(Paper.owner_id == uid)
+            .scalar_subquery().label("total_citations"),
         )
-        .scalar() or 0
-    )
-
-    # KPI 4: Total citations across all papers
-    total_citations = (
-        db.query(func.sum(Paper.citations))
-        .filter_by(owner_id=uid)
-        .scalar() or 0
-    )
+    ).one()
 
     # Recent papers (last 5 imported)
-    recent_papers = (
-        db.query(Paper)
+    recent = (
+        db.query(Paper.id if ids_only else Paper)
         .filter_by(owner_id=uid)
         .order_by(Paper.created_at.desc())
         .limit(5)
         .all()
     )
+    # Active workspaces – top 3 by paper count (one GROUP BY)
+    paper_count = func.count(WorkspacePaper.id)
+    rows = (
+        db.query(Workspace.id if ids_only else Workspace, paper_count.label("paper_count"))
+        .outerjoin(WorkspacePaper, WorkspacePaper.workspace_id == Workspace.id)
+        .filter(Workspace.owner_id == uid)
+        .group_by(Workspace.id)
+        .order_by(paper_count.desc())
+        .limit(3)
+        .all()
+    )
 
-    # Active workspaces – top 3 by paper count
-    workspaces = db.query(Workspace).filter_by(owner_id=uid).all()
-    ws_with_count = []
-    for ws in workspaces:
-        count = db.query(WorkspacePaper).filter_by(workspace_id=ws.id).count()
-        out   = WorkspaceOut.model_validate(ws)
-        out.paper_count = count
-        ws_with_count.append((count, out))
-    ws_with_count.sort(key=lambda x: x[0], reverse=True)
-    active_workspaces = [ws for _, ws in ws_with_count[:3]]
-
-    return DashboardStats(
-        total_papers      = total_papers,
-        total_workspaces  = total_workspaces,
-        ai_queries_today  = ai_queries_today,
-        total_citations   = int(total_citations),
-        recent_papers     = recent_papers,
-        active_workspaces = active_workspaces,
+    totals = dict(
+        total_papers     = kpis.total_papers,
+        total_workspaces = kpis.total_workspaces,
+        ai_queries_today = kpis.ai_queries_today,
+        total_citations  = int(kpis.total_citations),
     )
+    if ids_only:
+        stats = DashboardStatsLean.model_construct(
+            **totals,
+            recent_paper_ids     = [paper_id for paper_id, in recent],
+            active_workspace_ids = [ws_id for ws_id, _ in rows],
+        )
+    else:
+        stats = DashboardStats.model_construct(
+            **totals,
+            recent_papers     = [PaperOut.from_row(p) for p in recent],
+            active_workspaces = [WorkspaceOut.from_row(ws, paper_count=count) for ws, count in rows],
+        )
+
+    body = stats.model_dump_json().encode()
+    cache_set(key, body, DASHBOARD_TTL)
+    return Response(content=body, media_type="application/json")
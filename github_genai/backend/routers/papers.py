@@ -4,40 +4,64 @@ Paper endpoints – matching Search Papers & AI Tools pages.
 
 GET  /papers/search              – search arXiv + PubMed
 POST /papers/import              – save a paper to the user's library
+POST /papers/import-bulk         – save many papers in one round-trip
 GET  /papers/                    – list all imported papers
+GET  /papers/columns             – same list as parallel columns (table view)
 GET  /papers/semantic-search     – vector similarity search
 GET  /papers/{id}/related        – related papers
+GET  /papers/{id}/full           – one paper including extracted full text
 DELETE /papers/{id}              – remove a paper
 POST /papers/ai-tools            – AI Summaries / Key Insights / Lit Review
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import Response
+from sqlalchemy     import insert, tuple_
+from sqlalchemy.orm import Session, joinedload
 
 from models.database import (
     Paper, User, Workspace, WorkspacePaper, get_db,
 )
 from models.schemas  import (
-    AIToolRequest, AIToolResponse, PaperImport, PaperOut,
-    PaperSearchResult, SemanticSearchResult,
+    AIToolRequest, AIToolResponse, PaperFullOut, PaperImport, PaperOut, PaperOutListAdapter,
+    PaperListColumns, PaperSearchResult, PaperSearchResultListAdapter, SemanticSearchResult,
+    SemanticSearchResultListAdapter,
 )
 from utils.arxiv_client  import search_arxiv,  get_arxiv_paper
+from utils.cache         import (
+    AI_TOOL_TTL, bust_dashboard, bust_search, cache_get, cache_set,
+)
+from utils.embed_queue   import enqueue_embedding
 from utils.groq_client   import (
     extract_key_insights, generate_literature_review, generate_summaries,
 )
 from utils.pubmed_client import search_pubmed, get_pubmed_paper
-from utils.security      import get_current_user
+from utils.security      import get_current_user, owns_workspace
 from utils.vector_db     import (
-    create_embedding, get_related_papers, semantic_search,
+    create_embeddings_bulk, get_related_papers, semantic_search,
 )
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/papers", tags=["Papers"])
 
+# PaperListColumns field → the column it is read from
+_TABLE_COLUMNS = {
+    "ids":             Paper.id,
+    "sources":         Paper.source,
+    "titles":          Paper.title,
+    "authors":         Paper.authors,
+    "published_dates": Paper.published_date,
+    "venues":          Paper.venue,
+    "citations":       Paper.citations,
+    "tags":            Paper.tags,
+}
+
 
 # ── 1. SEARCH (arXiv + PubMed combined) ──────────────────────
 @router.get("/search", response_model=List[PaperSearchResult])
@@ -51,35 +75,36 @@ async def search_papers(
     Powers the Search Papers page.
     Queries arXiv, PubMed, or both and returns merged results.
     """
-    results: List[PaperSearchResult] = []
-
+    # Both sources are independent HTTP round-trips – run them concurrently
+    searches = []
     if source in ("arxiv", "all"):
-        results.extend(await search_arxiv(query, max_results))
-
+        searches.append(search_arxiv(query, max_results))
     if source in ("pubmed", "all"):
-        results.extend(await search_pubmed(query, max_results))
+        searches.append(search_pubmed(query, max_results))
 
-    # De-duplicate
-    seen, unique = set(), []
+    results: List[PaperSearchResult] = [
+        r for batch in await asyncio.gather(*searches) for r in batch
+    ]
+
+    # De-duplicate in one pass (first occurrence wins, order preserved)
+    unique: dict = {}
     for r in results:
-        key = (r.source, r.external_id)
-        if key not in seen:
-            seen.add(key)
-            unique.append(r)
+        unique.setdefault((r.source, r.external_id), r)
 
-    return unique
+    body = PaperSearchResultListAdapter.dump_json(list(unique.values()))
+    return Response(content=body, media_type="application/json")
 
 
 # ── 2. IMPORT ─────────────────────────────────────────────────
 @router.post("/import", response_model=PaperOut)
-async def import_paper(
+def import_paper(
     data:         PaperImport,
     db:           Session = Depends(get_db),
     current_user: User    = Depends(get_current_user),
 ):
     """
     Save a search result or manual entry to the user's library.
-    Creates a vector embedding automatically.
+    Queues a vector embedding automatically (computed in the background).
     Optionally links the paper to a workspace via workspace_id.
     """
     # Check for duplicate
@@ -96,37 +121,116 @@ async def import_paper(
     if existing:
         paper = existing
     else:
-        paper = Paper(
-            external_id    = data.external_id,
-            source         = data.source,
-            title          = data.title,
-            authors        = json.dumps(data.authors or []),
-            abstract       = data.abstract,
-            published_date = data.published_date,
-            url            = data.url,
-            pdf_url        = data.pdf_url,
-            journal        = data.journal,
-            venue          = data.venue,
-            doi            = data.doi,
-            citations      = data.citations or 0,
-            tags           = json.dumps(data.tags or []),
-            owner_id       = current_user.id,
-        )
+        paper = Paper(**_paper_values(data, current_user.id))
         db.add(paper)
         db.commit()
         db.refresh(paper)
 
-        # Generate embedding (non-blocking failure)
-        try:
-            create_embedding(db, paper)
-        except Exception as e:
-            logger.warning(f"Embedding failed for paper {paper.id}: {e}")
+        # Embedded in the background, batched with other new papers
+        enqueue_embedding(paper.id)
 
     # Link to workspace if provided
     if data.workspace_id:
         _link_to_workspace(db, paper.id, data.workspace_id, current_user.id)
 
-    return paper
+    bust_dashboard(current_user.id)
+    return PaperOut.from_row(paper)
+
+
+@router.post("/import-bulk", response_model=List[PaperOut])
+def import_papers_bulk(
+    items:        List[PaperImport],
+    db:           Session = Depends(get_db),
+    current_user: User    = Depends(get_current_user),
+):
+    """
+    Save many search results at once (e.g. "import all results").
+    New papers go in with one multi-row INSERT, are embedded in one
+    batched encode and their vectors land via a single binary COPY.
+    Everything commits together; embedding failure is non-blocking.
+    """
+    if not items:
+        return []
+
+    # Existing papers for this owner, matched on (source, external_id)
+    keys = {(d.source, d.external_id) for d in items if d.external_id}
+    found: dict = {}
+    if keys:
+        rows = db.query(Paper).filter(
+            Paper.owner_id == current_user.id,
+            tuple_(Paper.source, Paper.external_id).in_(keys),
+        ).all()
+        found = {(p.source, p.external_id): p for p in rows}
+
+    # Insert the rest, de-duplicated within the batch as well
+    fresh, seen = [], set()
+    for d in items:
+        key = (d.source, d.external_id)
+        if d.external_id and (key in found or key in seen):
+            continue
+        seen.add(key)
+        fresh.append(d)
+
+    new_papers: List[Paper] = []
+    if fresh:
+        new_papers = list(db.scalars(
+            insert(Paper).returning(Paper, sort_by_parameter_order=True),
+            [_paper_values(d, current_user.id) for d in fresh],
+        ))
+        found.update({(p.source, p.external_id): p for p in new_papers if p.external_id})
+
+    # Resolve every item to its paper, keeping request order – items with an
+    # external_id go through `found`, the rest take the id-less inserts in turn
+    it_new = iter([p for p in new_papers if not p.external_id])
+    papers = [
+        found[(d.source, d.external_id)] if d.external_id else next(it_new)
+        for d in items
+    ]
+
+    # Workspace links, validated once per workspace
+    links  = {(d.workspace_id, p.id) for d, p in zip(items, papers) if d.workspace_id}
+    ws_ids = {ws_id for ws_id, _ in links}
+    if ws_ids:
+        owned = {
+            ws_id for (ws_id,) in db.query(Workspace.id).filter(
+                Workspace.id.in_(ws_ids), Workspace.owner_id == current_user.id,
+            )
+        }
+        if owned != ws_ids:
+            raise HTTPException(status_code=404, detail="Workspace not found.")
+        linked = set(
+            db.query(WorkspacePaper.workspace_id, WorkspacePaper.paper_id).filter(
+                WorkspacePaper.workspace_id.in_(ws_ids),
+                WorkspacePaper.paper_id.in_({pid for _, pid in links}),
+            ).all()
+        )
+        db.add_all([
+            WorkspacePaper(workspace_id=ws_id, paper_id=pid)
+            for ws_id, pid in links - linked
+        ])
+        db.flush()
+
+    # Embeddings in a savepoint so a COPY failure keeps the papers; those
+    # are handed to the background queue once the papers are committed
+    retry_ids: List[int] = []
+    try:
+        with db.begin_nested():
+            create_embeddings_bulk(db, new_papers)
+    except Exception as e:
+        logger.warning(f"Bulk embedding failed for {len(new_papers)} papers, queued instead: {e}")
+        retry_ids = [p.id for p in new_papers]
+
+    db.commit()
+    for paper_id in retry_ids:
+        enqueue_embedding(paper_id)
+    bust_dashboard(current_user.id)
+    bust_search(current_user.id)
+
+    # Commit expired every instance – refresh them in one SELECT rather
+    # than one lazy load per paper during serialization
+    db.query(Paper).filter(Paper.id.in_({p.id for p in papers})).all()
+    body = PaperOutListAdapter.dump_json([PaperOut.from_row(p) for p in papers])
+    return Response(content=body, media_type="application/json")
 
 
 # ── 3. LIST ───────────────────────────────────────────────────
@@ -148,7 +252,31 @@ def list_papers(
         )
     else:
         papers = db.query(Paper).filter_by(owner_id=current_user.id).all()
-    return papers
+    body = PaperOutListAdapter.dump_json([PaperOut.from_row(p) for p in papers])
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/columns", response_model=PaperListColumns)
+def list_paper_columns(
+    workspace_id: Optional[int] = Query(None),
+    db:           Session       = Depends(get_db),
+    current_user: User          = Depends(get_current_user),
+):
+    """
+    The library as parallel columns for the table view. Selects only the
+    displayed columns – plain tuples, no Paper instances are built.
+    """
+    q = db.query(*_TABLE_COLUMNS.values()).filter(Paper.owner_id == current_user.id)
+    if workspace_id:
+        q = (
+            q.join(WorkspacePaper, WorkspacePaper.paper_id == Paper.id)
+            .filter(WorkspacePaper.workspace_id == workspace_id)
+        )
+    columns = list(zip(*q.all())) or [()] * len(_TABLE_COLUMNS)
+    table   = PaperListColumns.model_construct(
+        **{name: list(col) for name, col in zip(_TABLE_COLUMNS, columns)}
+    )
+    return Response(content=table.model_dump_json(), media_type="application/json")
 
 
 # ── 4. SEMANTIC SEARCH ────────────────────────────────────────
@@ -164,10 +292,12 @@ def semantic_search_endpoint(
     Returns papers ranked by conceptual similarity, not keyword match.
     """
     ranked = semantic_search(db, query=query, owner_id=current_user.id, top_k=top_k)
-    return [
-        SemanticSearchResult(paper=paper, similarity=round(score, 4))
+    hits = [
+        SemanticSearchResult.model_construct(paper=PaperOut.from_row(paper), similarity=round(score, 4))
         for paper, score in ranked
     ]
+    body = SemanticSearchResultListAdapter.dump_json(hits)
+    return Response(content=body, media_type="application/json")
 
 
 # ── 5. RELATED PAPERS ─────────────────────────────────────────
@@ -179,13 +309,34 @@ def related_papers(
     current_user: User    = Depends(get_current_user),
 ):
     ranked = get_related_papers(db, paper_id=paper_id, owner_id=current_user.id, top_k=top_k)
-    return [
-        SemanticSearchResult(paper=paper, similarity=round(score, 4))
+    hits = [
+        SemanticSearchResult.model_construct(paper=PaperOut.from_row(paper), similarity=round(score, 4))
         for paper, score in ranked
     ]
+    body = SemanticSearchResultListAdapter.dump_json(hits)
+    return Response(content=body, media_type="application/json")
+
+
+# ── 6. FULL TEXT ──────────────────────────────────────────────
+@router.get("/{paper_id}/full", response_model=PaperFullOut)
+def get_paper_full(
+    paper_id:     int,
+    db:           Session = Depends(get_db),
+    current_user: User    = Depends(get_current_user),
+):
+    """Single paper with full_text, which list endpoints leave out."""
+    paper = (
+        db.query(Paper)
+        .options(joinedload(Paper.fulltext), joinedload(Paper.document))
+        .filter_by(id=paper_id, owner_id=current_user.id)
+        .first()
+    )
+    if not paper:
+        raise HTTPException(status_code=404, detail="Paper not found.")
+    return PaperFullOut.from_row(paper)
 
 
-# ── 6. DELETE ─────────────────────────────────────────────────
+# ── 7. DELETE ─────────────────────────────────────────────────
 @router.delete("/{paper_id}", status_code=204)
 def delete_paper(
     paper_id:     int,
@@ -197,12 +348,15 @@ def delete_paper(
         raise HTTPException(status_code=404, detail="Paper not found.")
     db.delete(paper)
     db.commit()
+    bust_dashboard(current_user.id)
+    bust_search(current_user.id)
 
 
-# ── 7. AI TOOLS ───────────────────────────────────────────────
+# ── 8. AI TOOLS ───────────────────────────────────────────────
 @router.post("/ai-tools", response_model=AIToolResponse)
 def ai_tools(
     req:          AIToolRequest,
+    background:   BackgroundTasks,
     db:           Session = Depends(get_db),
     current_user: User    = Depends(get_current_user),
 ):
@@ -218,30 +372,32 @@ def ai_tools(
     if not papers:
         raise HTTPException(status_code=404, detail="No matching papers found.")
 
+    papers.sort(key=lambda p: p.id)   # stable prompt order → stable cache key
     paper_dicts = [
         {
             "title":    p.title,
-            "authors":  _parse_json_field(p.authors),
+            "authors":  p.authors or [],
             "abstract": p.abstract or "",
             "published_date": p.published_date or "",
         }
         for p in papers
     ]
 
-    tool_map = {
-        "summarize":         generate_summaries,
-        "insights":          extract_key_insights,
-        "literature_review": generate_literature_review,
-    }
+    fn = _AI_TOOLS[req.tool_type]   # AIToolRequest rejects unknown tool types
 
-    fn = tool_map.get(req.tool_type)
-    if not fn:
-        raise HTTPException(status_code=400, detail=f"Unknown tool_type: {req.tool_type}")
-
-    try:
-        result = fn(paper_dicts)
-    except RuntimeError as e:
-        raise HTTPException(status_code=502, detail=str(e))
+    # Same tool over the same paper content → reuse the earlier answer
+    cached = cache_get(_ai_tool_key(req.tool_type, paper_dicts))
+    if cached is not None:
+        result = cached.decode()
+    else:
+        try:
+            result = fn(paper_dicts)
+        except RuntimeError as e:
+            raise HTTPException(status_code=502, detail=str(e))
+        cache_set(_ai_tool_key(req.tool_type, paper_dicts), result.encode(), AI_TOOL_TTL)
+        # The other tabs are filled after the response is sent, so
+        # switching tool is usually a cache hit
+        background.add_task(_warm_ai_tools, paper_dicts, req.tool_type)
 
     return AIToolResponse(
         tool_type = req.tool_type,
@@ -251,9 +407,54 @@ def ai_tools(
 
 
 # ── Helpers ───────────────────────────────────────────────────
+_AI_TOOLS = {
+    "summarize":         generate_summaries,
+    "insights":          extract_key_insights,
+    "literature_review": generate_literature_review,
+}
+
+
+def _warm_ai_tools(paper_dicts: List[dict], skip: str) -> None:
+    """Cache the AI tools the user has not asked for yet, one Groq call each."""
+    for tool, fn in _AI_TOOLS.items():
+        key = _ai_tool_key(tool, paper_dicts)
+        if tool == skip or cache_get(key) is not None:
+            continue
+        try:
+            cache_set(key, fn(paper_dicts).encode(), AI_TOOL_TTL)
+        except RuntimeError as exc:
+            logger.warning(f"Warming AI tool '{tool}' failed: {exc}")
+            return   # Groq is failing – don't spend the remaining calls
+
+
+def _paper_values(data: PaperImport, owner_id: int) -> dict:
+    return dict(
+        external_id    = data.external_id,
+        source         = data.source,
+        title          = data.title,
+        authors        = data.authors,
+        abstract       = data.abstract,
+        published_date = data.published_date,
+        url            = data.url,
+        pdf_url        = data.pdf_url,
+        journal        = data.journal,
+        venue          = data.venue,
+        doi            = data.doi,
+        citations      = data.citations,
+        tags           = data.tags,
+        owner_id       = owner_id,
+    )
+
+
+def _ai_tool_key(tool_type: str, paper_dicts: List[dict]) -> str:
+    # Keyed on content, not ids, so edits to a paper invalidate naturally
+    # and identical papers across users share one Groq call
+    blob = json.dumps([tool_type, paper_dicts], sort_keys=True, ensure_ascii=False)
+    return "ai:" + hashlib.sha256(blob.encode()).hexdigest()
+
+
 def _link_to_workspace(db: Session, paper_id: int, workspace_id: int, owner_id: int):
-    ws = db.query(Workspace).filter_by(id=workspace_id, owner_id=owner_id).first()
-    if not ws:
+    if not owns_workspace(db, owner_id, workspace_id):
         raise HTTPException(status_code=404, detail="Workspace not found.")
     exists = db.query(WorkspacePaper).filter_by(
         workspace_id=workspace_id, paper_id=paper_id
@@ -262,11 +463,3 @@ def _link_to_workspace(db: Session, paper_id: int, workspace_id: int, owner_id:
         db.add(WorkspacePaper(workspace_id=workspace_id, paper_id=paper_id))
         db.commit()
 
-
-def _parse_json_field(value: Optional[str]) -> list:
-    if not value:
-        return []
-    try:
-        return json.loads(value)
-    except Exception:
-        return [value]
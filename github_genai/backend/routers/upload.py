@@ -2,33 +2,47 @@
 """
 Upload & Doc Space endpoints.
 
-POST /upload/pdf                – Upload a PDF, extract text, generate AI summary
+POST /upload/pdf                – Upload a PDF, extract text, generate AI summary (background)
 GET  /upload/documents          – List all user documents (Doc Space page)
 POST /upload/notes              – Save a text note
 GET  /upload/documents/{id}     – Get document content
 DELETE /upload/documents/{id}   – Delete a document
 """
 
-import io
 import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, UploadFile
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
-from models.database import Document, Paper, User, Workspace, get_db
-from models.schemas  import DocumentOut, NoteCreate, UploadResponse
-from utils.groq_client import summarize_pdf_text
+from models.database import (
+    Document, Paper, PaperFullText, SessionLocal, User, Workspace, WorkspacePaper, get_db,
+)
+from models.schemas  import DocumentOut, DocumentOutListAdapter, NoteCreate, UploadResponse
+from utils.cache       import bust_dashboard
+from utils.embed_queue import enqueue_embedding
+from utils.groq_client import SUMMARY_INPUT_CHARS, summarize_pdf_text
+from utils.pdf_text    import extract_pdf_text
 from utils.security    import get_current_user
-from utils.vector_db   import create_embedding
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/upload", tags=["Upload & Doc Space"])
 
+SPOOL_CHUNK = 1024 * 1024   # bytes per copy step when spooling an upload to disk
+
+# Groq summaries start mid-extraction, once enough text is available
+_summary_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="summary")
+
 
 # ── Upload PDF ────────────────────────────────────────────────
 @router.post("/pdf", response_model=UploadResponse)
-async def upload_pdf(
+def upload_pdf(
+    background:   BackgroundTasks,
     file:         UploadFile    = File(...),
     workspace_id: Optional[int] = Form(None),
     auto_summary: bool          = Form(True),
@@ -39,31 +53,22 @@ async def upload_pdf(
     """
     Powers the Upload PDF page pipeline:
     1. Receive PDF file
-    2. Extract text (PyMuPDF)
+    2. Extract text (pypdfium2 / PyMuPDF)
     3. Parse basic metadata from filename
-    4. Generate AI summary via Groq (if auto_summary=True)
+    4. Generate AI summary via Groq (if auto_summary=True) – started as
+       soon as the first SUMMARY_INPUT_CHARS are extracted, and saved to
+       the Paper after the response is sent (summary_status="pending";
+       poll GET /upload/documents/{id} for ai_summary)
     5. Save to documents table
     6. Optionally link to a workspace
     7. Create a Paper record so it appears in the user's library
-    8. Generate vector embedding (if create_emb=True)
+    8. Queue the vector embedding (if create_emb=True) – it is computed
+       in the background, batched with other new papers, once the
+       summary is in
     """
     if not file.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are accepted.")
 
-    contents = await file.read()
-    size_bytes = len(contents)
-
-    # ── Extract text with PyMuPDF ─────────────────────────────
-    text, page_count = _extract_pdf_text(contents)
-
-    # ── AI Summary ────────────────────────────────────────────
-    ai_summary = None
-    if auto_summary and text.strip():
-        try:
-            ai_summary = summarize_pdf_text(text, title=file.filename)
-        except RuntimeError as e:
-            logger.warning(f"AI summary failed: {e}")
-
     # ── Validate workspace ────────────────────────────────────
     ws_name = None
     if workspace_id:
@@ -74,6 +79,28 @@ async def upload_pdf(
             raise HTTPException(status_code=404, detail="Workspace not found.")
         ws_name = ws.name
 
+    # ── Extract text, kicking off the summary early ───────────
+    summary: List[Future] = []
+
+    def start_summary(head: str):
+        summary.append(_summary_pool.submit(summarize_pdf_text, head, title=file.filename))
+
+    # Copy the upload to a named temp file in 1 MB steps and extract from
+    # the path – the PDF is never held in memory as one bytes object
+    # (sync endpoint – runs in the threadpool)
+    spool = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+    try:
+        with spool:
+            shutil.copyfileobj(file.file, spool, SPOOL_CHUNK)
+            size_bytes = spool.tell()
+        text, page_count = extract_pdf_text(
+            spool.name,
+            on_head    = start_summary if auto_summary else None,
+            head_chars = SUMMARY_INPUT_CHARS + 1,   # +1 so the summarizer marks it truncated
+        )
+    finally:
+        os.unlink(spool.name)
+
     # ── Save to Document table ────────────────────────────────
     doc = Document(
         name         = file.filename,
@@ -90,39 +117,79 @@ async def upload_pdf(
     paper = Paper(
         source       = "upload",
         title        = file.filename.replace(".pdf", ""),
-        abstract     = ai_summary or text[:500],
-        full_text    = text,
-        ai_summary   = ai_summary,
+        abstract     = text[:500],                  # replaced by the AI summary
+        document     = doc,                         # full_text is read from doc.content
         owner_id     = current_user.id,
     )
-    db.add(paper)
-    db.commit()
-    db.refresh(paper)
 
     # ── Link to workspace ─────────────────────────────────────
     if workspace_id:
-        from models.database import WorkspacePaper
-        db.add(WorkspacePaper(workspace_id=workspace_id, paper_id=paper.id))
-        db.commit()
+        paper.workspaces.append(WorkspacePaper(workspace_id=workspace_id))
+
+    # Document, Paper and link go out in one transaction;
+    # flush assigns the ids, so nothing needs re-reading after commit
+    db.add(paper)
+    db.flush()
+    doc_id, paper_id = doc.id, paper.id
+    db.commit()
 
-    # ── Vector embedding ──────────────────────────────────────
-    if create_emb and text.strip():
-        try:
-            create_embedding(db, paper)
-        except Exception as e:
-            logger.warning(f"Embedding failed for uploaded PDF: {e}")
+    # ── AI summary + vector embedding (after the response) ────
+    summarize = auto_summary and bool(text.strip())
+    if summarize:
+        background.add_task(
+            _enrich_paper,
+            paper_id,
+            current_user.id,
+            summary[0] if summary else None,
+            text[:SUMMARY_INPUT_CHARS + 1],
+            file.filename,
+            create_emb,
+        )
+    elif create_emb and text.strip():
+        enqueue_embedding(paper_id)
 
-    db.refresh(doc)
+    bust_dashboard(current_user.id)
     return UploadResponse(
-        document_id = doc.id,
-        name        = file.filename,
-        pages       = page_count,
-        size_bytes  = size_bytes,
-        ai_summary  = ai_summary,
-        workspace   = ws_name,
+        document_id    = doc_id,
+        paper_id       = paper_id,
+        name           = file.filename,
+        pages          = page_count,
+        size_bytes     = size_bytes,
+        ai_summary     = None,
+        summary_status = "pending" if summarize else "none",
+        workspace      = ws_name,
     )
 
 
+def _enrich_paper(
+    paper_id:   int,
+    owner_id:   int,
+    started:    Optional[Future],
+    head:       str,
+    title:      str,
+    create_emb: bool,
+):
+    """Background step of upload_pdf: save the AI summary, then queue the embedding."""
+    try:
+        ai_summary = started.result() if started else summarize_pdf_text(head, title=title)
+    except RuntimeError as e:
+        logger.warning(f"AI summary failed: {e}")
+        ai_summary = None
+
+    if ai_summary:
+        with SessionLocal() as session:
+            session.query(Paper).filter_by(id=paper_id).update(
+                {"ai_summary": ai_summary, "abstract": ai_summary},
+                synchronize_session=False,
+            )
+            session.commit()
+        bust_dashboard(owner_id)
+
+    # After the summary, so the vector reflects the final abstract
+    if create_emb:
+        enqueue_embedding(paper_id)
+
+
 # ── List documents ────────────────────────────────────────────
 @router.get("/documents", response_model=List[DocumentOut])
 def list_documents(
@@ -137,7 +204,9 @@ def list_documents(
         q = q.filter_by(doc_type=doc_type)
     if workspace_id:
         q = q.filter_by(workspace_id=workspace_id)
-    return q.order_by(Document.created_at.desc()).all()
+    docs = [DocumentOut.from_row(d) for d in q.order_by(Document.created_at.desc())]
+    body = DocumentOutListAdapter.dump_json(docs)
+    return Response(content=body, media_type="application/json")
 
 
 # ── Get document content ──────────────────────────────────────
@@ -147,9 +216,15 @@ def get_document(
     db:           Session = Depends(get_db),
     current_user: User    = Depends(get_current_user),
 ):
-    doc = db.query(Document).filter_by(id=doc_id, owner_id=current_user.id).first()
-    if not doc:
+    row = (
+        db.query(Document, Paper.ai_summary)
+        .outerjoin(Paper, Paper.document_id == Document.id)
+        .filter(Document.id == doc_id, Document.owner_id == current_user.id)
+        .first()
+    )
+    if not row:
         raise HTTPException(status_code=404, detail="Document not found.")
+    doc, ai_summary = row
     return {
         "id":           doc.id,
         "name":         doc.name,
@@ -158,6 +233,7 @@ def get_document(
         "size_bytes":   doc.size_bytes,
         "page_count":   doc.page_count,
         "workspace_id": doc.workspace_id,
+        "ai_summary":   ai_summary,        # null while an upload summary is pending
         "created_at":   doc.created_at,
     }
 
@@ -182,7 +258,7 @@ def save_note(
     db.add(doc)
     db.commit()
     db.refresh(doc)
-    return doc
+    return DocumentOut.from_row(doc)
 
 
 # ── Delete document ───────────────────────────────────────────
@@ -195,27 +271,15 @@ def delete_document(
     doc = db.query(Document).filter_by(id=doc_id, owner_id=current_user.id).first()
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found.")
-    db.delete(doc)
-    db.commit()
 
-
-# ── PDF text extraction ───────────────────────────────────────
-def _extract_pdf_text(contents: bytes) -> tuple[str, int]:
-    """
-    Extract text from PDF bytes using PyMuPDF (fitz).
-    Returns (full_text, page_count).
-    Falls back to empty string if extraction fails.
-    """
-    try:
-        import fitz  # PyMuPDF
-        doc    = fitz.open(stream=contents, filetype="pdf")
-        pages  = doc.page_count
-        text   = "\n\n".join(
-            doc.load_page(i).get_text("text")
-            for i in range(min(pages, 50))   # cap at 50 pages
+    # Papers read an upload's text from its document – hand them their own
+    # copy first, since the FK only nulls papers.document_id
+    if doc.content:
+        paper_ids = (
+            db.query(Paper.id)
+            .filter(Paper.document_id == doc.id, ~Paper.fulltext.has())
+            .all()
         )
-        doc.close()
-        return text, pages
-    except Exception as e:
-        logger.error(f"PDF extraction failed: {e}")
-        return "", 0
+        db.add_all(PaperFullText(paper_id=pid, text=doc.content) for pid, in paper_ids)
+    db.delete(doc)
+    db.commit()
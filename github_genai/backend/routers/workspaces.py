@@ -12,18 +12,23 @@ POST   /workspaces/{id}/papers/{paper_id} – add paper to workspace
 DELETE /workspaces/{id}/papers/{paper_id} – remove paper from workspace
 """
 
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response
+from sqlalchemy import exists, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from models.database import (
     Paper, User, Workspace, WorkspacePaper, get_db,
 )
 from models.schemas  import (
-    PaperOut, WorkspaceCreate, WorkspaceOut, WorkspaceUpdate,
+    PaperOut, PaperOutListAdapter, WorkspaceCreate, WorkspaceOut, WorkspaceOutListAdapter,
+    WorkspaceUpdate,
 )
-from utils.security  import get_current_user
+from utils.cache     import bust_dashboard
+from utils.security  import get_current_user, owns_workspace
 
 router = APIRouter(prefix="/workspaces", tags=["Workspaces"])
 
@@ -34,14 +39,8 @@ def list_workspaces(
     db:           Session = Depends(get_db),
     current_user: User    = Depends(get_current_user),
 ):
-    workspaces = db.query(Workspace).filter_by(owner_id=current_user.id).all()
-    result = []
-    for ws in workspaces:
-        count = db.query(WorkspacePaper).filter_by(workspace_id=ws.id).count()
-        out   = WorkspaceOut.model_validate(ws)
-        out.paper_count = count
-        result.append(out)
-    return result
+    body = WorkspaceOutListAdapter.dump_json(_with_counts(db, current_user.id))
+    return Response(content=body, media_type="application/json")
 
 
 # ── Create ────────────────────────────────────────────────────
@@ -60,10 +59,9 @@ def create_workspace(
     )
     db.add(ws)
     db.commit()
+    bust_dashboard(current_user.id)
     db.refresh(ws)
-    out = WorkspaceOut.model_validate(ws)
-    out.paper_count = 0
-    return out
+    return WorkspaceOut.from_row(ws, paper_count=0)
 
 
 # ── Get one ───────────────────────────────────────────────────
@@ -73,10 +71,10 @@ def get_workspace(
     db:           Session = Depends(get_db),
     current_user: User    = Depends(get_current_user),
 ):
-    ws = _get_or_404(db, workspace_id, current_user.id)
-    out = WorkspaceOut.model_validate(ws)
-    out.paper_count = db.query(WorkspacePaper).filter_by(workspace_id=ws.id).count()
-    return out
+    rows = _with_counts(db, current_user.id, workspace_id)
+    if not rows:
+        raise HTTPException(status_code=404, detail="Workspace not found.")
+    return rows[0]
 
 
 # ── Update ────────────────────────────────────────────────────
@@ -91,10 +89,8 @@ def update_workspace(
     for field, value in data.model_dump(exclude_none=True).items():
         setattr(ws, field, value)
     db.commit()
-    db.refresh(ws)
-    out = WorkspaceOut.model_validate(ws)
-    out.paper_count = db.query(WorkspacePaper).filter_by(workspace_id=ws.id).count()
-    return out
+    bust_dashboard(current_user.id)
+    return _with_counts(db, current_user.id, workspace_id)[0]
 
 
 # ── Delete ────────────────────────────────────────────────────
@@ -107,6 +103,7 @@ def delete_workspace(
     ws = _get_or_404(db, workspace_id, current_user.id)
     db.delete(ws)
     db.commit()
+    bust_dashboard(current_user.id)
 
 
 # ── Papers in workspace ───────────────────────────────────────
@@ -116,14 +113,15 @@ def list_workspace_papers(
     db:           Session = Depends(get_db),
     current_user: User    = Depends(get_current_user),
 ):
-    _get_or_404(db, workspace_id, current_user.id)
+    _require_owner(db, workspace_id, current_user.id)
     papers = (
         db.query(Paper)
         .join(WorkspacePaper, WorkspacePaper.paper_id == Paper.id)
         .filter(WorkspacePaper.workspace_id == workspace_id)
         .all()
     )
-    return papers
+    body = PaperOutListAdapter.dump_json([PaperOut.from_row(p) for p in papers])
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/{workspace_id}/papers/{paper_id}", status_code=status.HTTP_201_CREATED)
@@ -133,18 +131,34 @@ def add_paper_to_workspace(
     db:           Session = Depends(get_db),
     current_user: User    = Depends(get_current_user),
 ):
-    _get_or_404(db, workspace_id, current_user.id)
-    paper = db.query(Paper).filter_by(id=paper_id, owner_id=current_user.id).first()
-    if not paper:
-        raise HTTPException(status_code=404, detail="Paper not found.")
-
-    exists = db.query(WorkspacePaper).filter_by(
-        workspace_id=workspace_id, paper_id=paper_id
+    # One INSERT … SELECT checks both ownerships and skips existing links;
+    # only when it inserts nothing do we look up which case it was
+    owned = (
+        select(Workspace.id, Paper.id)
+        .where(
+            Workspace.id == workspace_id, Workspace.owner_id == current_user.id,
+            Paper.id     == paper_id,     Paper.owner_id     == current_user.id,
+        )
+    )
+    inserted = db.execute(
+        insert(WorkspacePaper)
+        .from_select(["workspace_id", "paper_id"], owned)
+        .on_conflict_do_nothing(index_elements=["workspace_id", "paper_id"])
+        .returning(WorkspacePaper.id)
     ).first()
-    if not exists:
-        link = WorkspacePaper(workspace_id=workspace_id, paper_id=paper_id)
-        db.add(link)
-        db.commit()
+    db.commit()
+
+    if inserted:
+        bust_dashboard(current_user.id)
+    else:
+        ws_ok, paper_ok = db.execute(select(
+            exists().where(Workspace.id == workspace_id, Workspace.owner_id == current_user.id),
+            exists().where(Paper.id == paper_id, Paper.owner_id == current_user.id),
+        )).one()
+        if not ws_ok:
+            raise HTTPException(status_code=404, detail="Workspace not found.")
+        if not paper_ok:
+            raise HTTPException(status_code=404, detail="Paper not found.")
     return {"message": "Paper added to workspace."}
 
 
@@ -155,13 +169,13 @@ def remove_paper_from_workspace(
     db:           Session = Depends(get_db),
     current_user: User    = Depends(get_current_user),
 ):
-    _get_or_404(db, workspace_id, current_user.id)
-    link = db.query(WorkspacePaper).filter_by(
+    _require_owner(db, workspace_id, current_user.id)
+    deleted = db.query(WorkspacePaper).filter_by(
         workspace_id=workspace_id, paper_id=paper_id
-    ).first()
-    if link:
-        db.delete(link)
-        db.commit()
+    ).delete(synchronize_session=False)
+    db.commit()
+    if deleted:
+        bust_dashboard(current_user.id)
 
 
 # ── Helper ────────────────────────────────────────────────────
@@ -170,3 +184,23 @@ def _get_or_404(db: Session, workspace_id: int, owner_id: int) -> Workspace:
     if not ws:
         raise HTTPException(status_code=404, detail="Workspace not found.")
     return ws
+
+
+def _with_counts(db: Session, owner_id: int, workspace_id: Optional[int] = None) -> List[WorkspaceOut]:
+    """Workspaces with paper_count filled in by one LEFT JOIN / GROUP BY."""
+    q = (
+        db.query(Workspace, func.count(WorkspacePaper.id))
+        .outerjoin(WorkspacePaper, WorkspacePaper.workspace_id == Workspace.id)
+        .filter(Workspace.owner_id == owner_id)
+        .group_by(Workspace.id)
+    )
+    if workspace_id is not None:
+        q = q.filter(Workspace.id == workspace_id)
+
+    return [WorkspaceOut.from_row(ws, paper_count=count) for ws, count in q.all()]
+
+
+def _require_owner(db: Session, workspace_id: int, owner_id: int) -> None:
+    """Like _get_or_404 for callers that don't need the row itself."""
+    if not owns_workspace(db, owner_id, workspace_id):
+        raise HTTPException(status_code=404, detail="Workspace not found.")
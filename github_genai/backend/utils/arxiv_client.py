@@ -9,18 +9,55 @@ from __future__ import annotations
 import logging
 import re
 import urllib.parse
-import xml.etree.ElementTree as ET
 from typing import List, Optional
 
 import httpx
 
+try:
+    from lxml import etree          # C parser, same find/findall API
+    _XMLError = etree.XMLSyntaxError
+    # No entity resolution / network access – a DOCTYPE in the feed stays inert
+    _PARSER   = etree.XMLParser(resolve_entities=False, no_network=True)
+except ImportError:  # optional dependency – stdlib fallback
+    import xml.etree.ElementTree as etree
+    _XMLError = etree.ParseError
+    _PARSER   = None                # stdlib never fetches external entities
+
 from models.schemas import PaperSearchResult
+from utils.tagging  import keyword_tagger
 
 logger          = logging.getLogger(__name__)
-ARXIV_BASE      = "http://export.arxiv.org/api/query"
+ARXIV_BASE      = "https://export.arxiv.org/api/query"
 ATOM_NS         = "http://www.w3.org/2005/Atom"
 TIMEOUT         = 20
 
+_WS_RE          = re.compile(r"\s+")
+_ABS_PREFIX_RE  = re.compile(r"https?://arxiv\.org/abs/")
+
+# Title keyword → tag, matched in one pass by _auto_tags
+_TAG_KEYWORDS = {
+    "transformer": "Transformers", "attention": "Attention",
+    "bert": "BERT", "gpt": "GPT", "llm": "LLM",
+    "diffusion": "Diffusion", "gan": "GANs",
+    "reinforcement": "RL", "vision": "Computer Vision",
+    "image": "Computer Vision", "medical": "Medical AI",
+    "neural": "Deep Learning", "language": "NLP",
+    "agent": "Agents", "graph": "Graph Neural Networks",
+}
+_auto_tags = keyword_tagger(_TAG_KEYWORDS)
+
+# One pooled client for the process – keep-alive connections are reused
+# across searches instead of paying DNS + TCP setup on every call
+_client = httpx.AsyncClient(
+    timeout = TIMEOUT,
+    limits  = httpx.Limits(max_keepalive_connections=20),
+)
+
+
+async def aclose_client() -> None:
+    """Shutdown hook – closes the pooled connections."""
+    await _client.aclose()
+
 
 async def search_arxiv(query: str, max_results: int = 10) -> List[PaperSearchResult]:
     params = {
@@ -32,35 +69,34 @@ async def search_arxiv(query: str, max_results: int = 10) -> List[PaperSearchRes
     }
     url = f"{ARXIV_BASE}?{urllib.parse.urlencode(params)}"
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as c:
-            r = await c.get(url)
-            r.raise_for_status()
+        r = await _client.get(url)
+        r.raise_for_status()
     except httpx.HTTPError as e:
         logger.error(f"arXiv error: {e}")
         return []
-    return _parse(r.text)
+    return _parse(r.content)
 
 
 async def get_arxiv_paper(arxiv_id: str) -> Optional[PaperSearchResult]:
-    clean = re.sub(r"https?://arxiv\.org/abs/", "", arxiv_id).strip()
+    clean = _ABS_PREFIX_RE.sub("", arxiv_id).strip()
     params = {"id_list": clean, "max_results": 1}
     url = f"{ARXIV_BASE}?{urllib.parse.urlencode(params)}"
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as c:
-            r = await c.get(url)
-            r.raise_for_status()
+        r = await _client.get(url)
+        r.raise_for_status()
     except httpx.HTTPError as e:
         logger.error(f"arXiv single fetch error: {e}")
         return None
-    results = _parse(r.text)
+    results = _parse(r.content)
     return results[0] if results else None
 
 
-def _parse(xml_text: str) -> List[PaperSearchResult]:
+def _parse(xml_bytes: bytes) -> List[PaperSearchResult]:
+    # Bytes, not str – lets the parser honour the feed's encoding declaration
     results = []
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError:
+        root = etree.fromstring(xml_bytes, _PARSER)
+    except _XMLError:
         return results
 
     ns = {"a": ATOM_NS, "ax": "http://arxiv.org/schemas/atom"}
@@ -71,23 +107,19 @@ def _parse(xml_text: str) -> List[PaperSearchResult]:
         abs_el = entry.find("a:summary",  ns)
         pub_el = entry.find("a:published",ns)
 
-        arxiv_url = (id_el.text  or "").strip() if id_el  else ""
-        arxiv_id  = re.sub(r"https?://arxiv\.org/abs/", "", arxiv_url).strip()
-        title     = _clean(ttl_el.text if ttl_el else "Untitled")
-        abstract  = _clean(abs_el.text if abs_el else "")
-        pub_date  = (pub_el.text or "")[:10] if pub_el else ""
+        # `is not None`, not truthiness – a leaf element is falsy in both parsers
+        arxiv_url = (id_el.text  or "").strip() if id_el  is not None else ""
+        arxiv_id  = _ABS_PREFIX_RE.sub("", arxiv_url).strip()
+        title     = _clean(ttl_el.text if ttl_el is not None else "Untitled")
+        abstract  = _clean(abs_el.text if abs_el is not None else "")
+        pub_date  = (pub_el.text or "")[:10] if pub_el is not None else ""
 
-        authors = [
-            _clean(n.text)
-            for auth in entry.findall("a:author", ns)
-            if (n := auth.find("a:name", ns)) is not None
-        ]
+        # Path expressions resolve inside the parser – one call each
+        # instead of a Python loop over every author / link element
+        authors = [_clean(n.text) for n in entry.findall("a:author/a:name", ns)]
 
-        pdf_url = None
-        for link in entry.findall("a:link", ns):
-            if link.attrib.get("title") == "pdf":
-                pdf_url = link.attrib.get("href", "").replace("http://", "https://")
-                break
+        pdf_el  = entry.find("a:link[@title='pdf']", ns)
+        pdf_url = pdf_el.get("href", "").replace("http://", "https://") if pdf_el is not None else None
 
         doi_el  = entry.find("ax:doi", ns)
         doi     = doi_el.text.strip() if doi_el is not None and doi_el.text else None
@@ -100,7 +132,8 @@ def _parse(xml_text: str) -> List[PaperSearchResult]:
         if not arxiv_id:
             continue
 
-        results.append(PaperSearchResult(
+        # Every field is built above with the right type – skip validation
+        results.append(PaperSearchResult.model_construct(
             external_id    = arxiv_id,
             source         = "arxiv",
             title          = title,
@@ -123,19 +156,4 @@ def _parse(xml_text: str) -> List[PaperSearchResult]:
 def _clean(text: Optional[str]) -> str:
     if not text:
         return ""
-    return re.sub(r"\s+", " ", text).strip()
-
-
-def _auto_tags(title: str) -> List[str]:
-    """Generate simple tags from title keywords."""
-    keywords = {
-        "transformer": "Transformers", "attention": "Attention",
-        "bert": "BERT", "gpt": "GPT", "llm": "LLM",
-        "diffusion": "Diffusion", "gan": "GANs",
-        "reinforcement": "RL", "vision": "Computer Vision",
-        "image": "Computer Vision", "medical": "Medical AI",
-        "neural": "Deep Learning", "language": "NLP",
-        "agent": "Agents", "graph": "Graph Neural Networks",
-    }
-    low = title.lower()
-    return list({v for k, v in keywords.items() if k in low})[:3]
+    return _WS_RE.sub(" ", text).strip()
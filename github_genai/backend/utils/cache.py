@@ -0,0 +1,115 @@
+# backend/utils/cache.py
+"""
+Small key/value cache for read-heavy, user-scoped responses.
+
+Uses Redis when REDIS_URL is set (shared across workers), otherwise an
+in-process TTL dict so single-worker dev setups behave the same way.
+Cache errors are never fatal – a failed GET is treated as a miss.
+"""
+
+import os
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+
+try:
+    import redis
+except ImportError:  # optional dependency
+    redis = None
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+REDIS_URL     = os.getenv("REDIS_URL")
+DASHBOARD_TTL = 60      # seconds
+AI_TOOL_TTL   = 86400   # AI-tool output is a pure function of its inputs
+PUBMED_TTL    = 86400   # parsed efetch records
+SEARCH_TTL    = 300     # semantic-search hit lists
+LOCAL_MAX     = 2048    # entry cap for the in-process fallback
+
+
+# ── Backend selection ─────────────────────────────────────────
+_redis = redis.Redis.from_url(REDIS_URL, socket_timeout=0.5) if (redis and REDIS_URL) else None
+
+_local: Dict[str, Tuple[float, bytes]] = {}
+_lock  = threading.Lock()
+
+
+# ═════════════════════════════════════════════════════════════
+# GET / SET / DELETE
+# ═════════════════════════════════════════════════════════════
+
+def cache_get(key: str) -> Optional[bytes]:
+    if _redis is not None:
+        try:
+            return _redis.get(key)
+        except Exception as e:
+            logger.warning(f"Cache GET failed for {key}: {e}")
+            return None
+
+    with _lock:
+        hit = _local.get(key)
+        if hit is None:
+            return None
+        expires, value = hit
+        if expires < time.monotonic():
+            del _local[key]
+            return None
+        return value
+
+
+def cache_set(key: str, value: bytes, ttl: int) -> None:
+    if _redis is not None:
+        try:
+            _redis.set(key, value, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Cache SET failed for {key}: {e}")
+        return
+
+    with _lock:
+        _local.pop(key, None)
+        _local[key] = (time.monotonic() + ttl, value)
+        while len(_local) > LOCAL_MAX:          # dicts keep insertion order –
+            del _local[next(iter(_local))]      # drop the oldest entry
+
+
+def cache_delete(*keys: str) -> None:
+    if not keys:
+        return
+    if _redis is not None:
+        try:
+            _redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Cache DELETE failed for {keys}: {e}")
+        return
+
+    with _lock:
+        for key in keys:
+            _local.pop(key, None)
+
+
+# ── Dashboard ─────────────────────────────────────────────────
+def dashboard_key(user_id: int, ids_only: bool = False) -> str:
+    return f"dash-ids:{user_id}" if ids_only else f"dash:{user_id}"
+
+
+def bust_dashboard(user_id: int) -> None:
+    """Call after any write that changes a user's dashboard numbers."""
+    cache_delete(dashboard_key(user_id), dashboard_key(user_id, ids_only=True))
+
+
+# ── Vector search ─────────────────────────────────────────────
+def search_version(user_id: int) -> str:
+    """Token baked into a user's search-result keys; changes on bust_search."""
+    v = cache_get(f"vecver:{user_id}")
+    return v.decode() if v is not None else "0"
+
+
+def bust_search(user_id: int) -> None:
+    """Call after a user's embeddings are added, replaced or deleted."""
+    # Outlives every result keyed on the previous token, so a lapsed
+    # version can't resurrect them
+    cache_set(f"vecver:{user_id}", str(time.time_ns()).encode(), SEARCH_TTL)
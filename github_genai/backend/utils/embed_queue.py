@@ -0,0 +1,107 @@
+# backend/utils/embed_queue.py
+"""
+Background embedding queue for new papers.
+
+Request handlers enqueue paper ids instead of embedding inline. A single
+daemon thread drains the queue up to BATCH_SIZE ids at a time – lingering
+briefly so a burst of uploads/imports shares one encode() call – and
+writes the vectors with create_embeddings_bulk on its own session.
+
+Jobs live in process memory, so ids pending at exit and batches that
+fail are not kept. Instead the worker sweeps for papers without a vector
+when it starts and again every SWEEP_INTERVAL seconds of idle time, and
+queues them – a lost or failed paper is embedded on the next sweep.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import List, Optional
+
+from models.database import Paper, SessionLocal
+from utils.cache     import bust_search
+from utils.vector_db import BATCH_SIZE, create_embeddings_bulk
+
+logger = logging.getLogger(__name__)
+
+LINGER         = 0.05   # seconds to wait for more ids before embedding a batch
+SWEEP_INTERVAL = 600    # idle seconds between sweeps for unembedded papers
+
+_queue:  "queue.Queue[int]"         = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_lock   = threading.Lock()
+
+
+def enqueue_embedding(paper_id: int) -> None:
+    """Schedule a committed paper for embedding; returns immediately."""
+    _ensure_worker()
+    _queue.put(paper_id)
+
+
+def start() -> None:
+    """Startup hook – starts the worker, whose first job is a sweep."""
+    _ensure_worker()
+
+
+def _ensure_worker() -> None:
+    global _worker
+    with _lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run, name="embed-queue", daemon=True)
+            _worker.start()
+
+
+def _run() -> None:
+    _sweep()
+    while True:
+        try:
+            batch = [_queue.get(timeout=SWEEP_INTERVAL)]
+        except queue.Empty:
+            _sweep()
+            continue
+        deadline = time.monotonic() + LINGER
+        while len(batch) < BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            _embed_batch(batch)
+        except Exception as e:
+            logger.error(f"Background embedding failed for papers {batch}, retried on next sweep: {e}")
+
+
+def _sweep() -> None:
+    """Queue every paper that has no embedding yet."""
+    try:
+        with SessionLocal() as db:
+            paper_ids = [pid for pid, in db.query(Paper.id).filter(~Paper.embedding.has())]
+    except Exception as e:
+        logger.error(f"Sweep for unembedded papers failed: {e}")
+        return
+    for paper_id in paper_ids:
+        _queue.put(paper_id)
+    if paper_ids:
+        logger.info(f"Sweep queued {len(paper_ids)} unembedded papers")
+
+
+def _embed_batch(paper_ids: List[int]) -> None:
+    with SessionLocal() as db:
+        # Skip papers deleted meanwhile or already embedded
+        papers = (
+            db.query(Paper)
+            .filter(Paper.id.in_(set(paper_ids)), ~Paper.embedding.has())
+            .order_by(Paper.id)
+            .all()
+        )
+        if papers:
+            owners = {p.owner_id for p in papers}   # read before commit expires them
+            create_embeddings_bulk(db, papers)
+            db.commit()
+            for owner_id in owners:
+                bust_search(owner_id)
@@ -8,17 +8,29 @@ Groq API wrapper powering:
 
 import os
 import logging
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from dotenv import load_dotenv
 from groq import Groq
 
+from utils import llm_cache
+
+try:
+    import tiktoken
+except ImportError:  # optional dependency – falls back to a chars-per-token estimate
+    tiktoken = None
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
 # ── Client & model config ─────────────────────────────────────
 _client = Groq(api_key=os.getenv("GROQ_API_KEY"))
 
+SUMMARY_INPUT_TOKENS = 1500   # PDF text sent to the summarizer
+SUMMARY_INPUT_CHARS  = 8000   # cheap pre-cut before tokenizing; callers need at most this much
+CHARS_PER_TOKEN      = 4      # estimate used when tiktoken is unavailable
+
 MODEL_CONFIG = {
     "model":       "llama-3.3-70b-versatile",
     "temperature": 0.3,
@@ -42,41 +54,86 @@ def chat_with_context(
     workspace_papers: list of dicts with keys title, authors, abstract
     conversation_history: list of {"role": "user"|"assistant", "content": str}
     """
-    # Build research context from papers
-    context_parts = []
-    for p in workspace_papers:
-        authors = p.get("authors", "Unknown")
-        if isinstance(authors, list):
-            authors = ", ".join(authors)
-        context_parts.append(
-            f"Paper: {p.get('title', 'Untitled')}\n"
-            f"Authors: {authors}\n"
-            f"Abstract: {p.get('abstract', 'No abstract')}"
-        )
-    context = "\n\n---\n\n".join(context_parts) if context_parts else "No papers loaded in this workspace."
-
-    system_prompt = (
-        "You are ResearchHub AI, an expert research assistant. "
-        "You have access to the following research papers in the user's workspace:\n\n"
-        f"{context}\n\n"
-        "Answer questions thoroughly, cite specific papers when relevant, "
-        "and provide actionable research insights. Use markdown formatting."
-    )
+    messages = _chat_messages(user_message, workspace_papers, conversation_history)
 
-    messages = [{"role": "system", "content": system_prompt}]
+    try:
+        return _complete(messages, MODEL_CONFIG)
+    except Exception as exc:
+        logger.error(f"Groq chat error: {exc}")
+        raise RuntimeError(f"AI service error: {exc}")
 
-    # Include recent conversation history (last 10 turns)
-    for turn in conversation_history[-10:]:
-        messages.append({"role": turn["role"], "content": turn["content"]})
 
-    messages.append({"role": "user", "content": user_message})
+def stream_chat_with_context(
+    user_message:     str,
+    workspace_papers: List[Dict],
+    conversation_history: List[Dict],
+) -> Iterator[str]:
+    """
+    Streaming variant of chat_with_context – yields text deltas as Groq
+    generates them. The request is opened eagerly, so connection and
+    auth errors raise RuntimeError here rather than mid-stream.
+    """
+    messages = _chat_messages(user_message, workspace_papers, conversation_history)
 
     try:
-        response = _client.chat.completions.create(messages=messages, **MODEL_CONFIG)
-        return response.choices[0].message.content
+        stream = _client.chat.completions.create(messages=messages, stream=True, **MODEL_CONFIG)
     except Exception as exc:
         logger.error(f"Groq chat error: {exc}")
         raise RuntimeError(f"AI service error: {exc}")
+    return _iter_deltas(stream)
+
+
+def _iter_deltas(stream) -> Iterator[str]:
+    try:
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
+    except Exception as exc:
+        logger.error(f"Groq stream error: {exc}")
+        raise RuntimeError(f"AI service error: {exc}")
+
+
+def _chat_messages(
+    user_message:     str,
+    workspace_papers: List[Dict],
+    conversation_history: List[Dict],
+) -> List[Dict]:
+    papers_key = tuple(
+        (p.get("title", "Untitled"), _authors_str(p.get("authors", "Unknown")), p.get("abstract", "No abstract"))
+        for p in workspace_papers
+    )
+    # System prompt first and byte-stable for a given paper set, so the
+    # prompt prefix is identical from turn to turn
+    messages = [{"role": "system", "content": _system_prompt(papers_key)}]
+
+    # Include recent conversation history (last 10 turns)
+    for turn in conversation_history[-10:]:
+        messages.append({"role": turn["role"], "content": turn["content"]})
+
+    messages.append({"role": "user", "content": user_message})
+    return messages
+
+
+@lru_cache(maxsize=256)
+def _system_prompt(papers: Tuple[Tuple[str, str, str], ...]) -> str:
+    """Research-context system prompt for (title, authors, abstract) triples."""
+    context = "\n\n---\n\n".join(
+        f"Paper: {title}\nAuthors: {authors}\nAbstract: {abstract}"
+        for title, authors, abstract in papers
+    ) or "No papers loaded in this workspace."
+
+    return (
+        "You are ResearchHub AI, an expert research assistant. "
+        "You have access to the following research papers in the user's workspace:\n\n"
+        f"{context}\n\n"
+        "Answer questions thoroughly, cite specific papers when relevant, "
+        "and provide actionable research insights. Use markdown formatting."
+    )
+
+
+def _authors_str(authors) -> str:
+    return ", ".join(authors) if isinstance(authors, list) else authors
 
 
 # ═════════════════════════════════════════════════════════════
@@ -156,8 +213,10 @@ def generate_literature_review(papers: List[Dict]) -> str:
 
 def summarize_pdf_text(text: str, title: str = "document") -> str:
     """Generate an AI summary from raw PDF text (Upload PDF page)."""
-    # Truncate very long documents to fit context window
-    truncated = text[:6000] + ("…[truncated]" if len(text) > 6000 else "")
+    # Truncate very long documents to fit context window – by tokens, on a
+    # bounded slice so the full text is never copied or tokenized
+    head      = _truncate_tokens(text[:SUMMARY_INPUT_CHARS], SUMMARY_INPUT_TOKENS)
+    truncated = head + ("…[truncated]" if len(head) < len(text) else "")
 
     prompt = (
         f"Summarize the following research paper titled '{title}' in 7 bullet points. "
@@ -173,14 +232,42 @@ def summarize_pdf_text(text: str, title: str = "document") -> str:
 # INTERNAL HELPER
 # ═════════════════════════════════════════════════════════════
 
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    enc = _encoder()
+    if enc is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    tokens = enc.encode(text, disallowed_special=())
+    return text if len(tokens) <= max_tokens else enc.decode(tokens[:max_tokens])
+
+
+@lru_cache(maxsize=1)
+def _encoder():
+    # cl100k_base is not Llama's own vocabulary, but it is close enough
+    # for budgeting and loads once per process
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as exc:   # encoding file is fetched on first use
+        logger.warning(f"tiktoken unavailable, estimating tokens from length: {exc}")
+        return None
+
+
 def _call_groq(prompt: str, max_tokens: int = 2000) -> str:
     config = {**MODEL_CONFIG, "max_tokens": max_tokens}
     try:
-        response = _client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            **config,
-        )
-        return response.choices[0].message.content
+        return _complete([{"role": "user", "content": prompt}], config)
     except Exception as exc:
         logger.error(f"Groq API error: {exc}")
         raise RuntimeError(f"AI service error: {exc}")
+
+
+def _complete(messages: List[Dict], config: Dict) -> str:
+    """One non-streaming completion, served from llm_cache when the exact prompt was seen."""
+    cached = llm_cache.lookup(messages, config)
+    if cached is not None:
+        return cached
+    response = _client.chat.completions.create(messages=messages, **config)
+    text     = response.choices[0].message.content
+    llm_cache.store(messages, config, text)
+    return text
@@ -0,0 +1,32 @@
+# backend/utils/llm_cache.py
+"""
+Exact-match cache for Groq chat completions.
+
+The key is a SHA-256 over the model settings and the full message list,
+so only byte-identical prompts hit – re-uploaded PDFs, repeated AI-tool
+runs, a re-asked question with the same history. Stored via utils.cache
+(Redis or the in-process fallback).
+"""
+
+import hashlib
+import json
+from typing import Dict, List, Optional
+
+from utils.cache import cache_get, cache_set
+
+LLM_TTL = 86400   # 24 h
+
+
+def llm_key(messages: List[Dict], config: Dict) -> str:
+    blob = json.dumps([config, messages], sort_keys=True, ensure_ascii=False)
+    return "llm:" + hashlib.sha256(blob.encode()).hexdigest()
+
+
+def lookup(messages: List[Dict], config: Dict) -> Optional[str]:
+    hit = cache_get(llm_key(messages, config))
+    return hit.decode() if hit is not None else None
+
+
+def store(messages: List[Dict], config: Dict, text: str) -> None:
+    if text:
+        cache_set(llm_key(messages, config), text.encode(), LLM_TTL)
@@ -0,0 +1,77 @@
+# backend/utils/onnx_encoder.py
+"""
+ONNX Runtime encoder for all-MiniLM-L6-v2 – an optional, faster stand-in
+for SentenceTransformer on CPU (INT8 weights run on MLAS int8 GEMM).
+
+Build the model directory once, at image build time:
+
+    optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 \
+        --task feature-extraction minilm-onnx/
+    python -c "from onnxruntime.quantization import quantize_dynamic, QuantType; \
+        quantize_dynamic('minilm-onnx/model.onnx', 'minilm-onnx/model_int8.onnx', \
+        weight_type=QuantType.QInt8)"
+
+then set EMBED_ONNX_DIR=minilm-onnx. Output matches the sentence-transformers
+pipeline (mean pooling over the attention mask, optional L2 normalisation),
+so vectors stay comparable with ones already stored.
+"""
+
+import os
+from typing import List, Union
+
+import numpy as np
+
+try:
+    import onnxruntime as ort
+    from tokenizers import Tokenizer
+except ImportError:  # optional dependency – vector_db uses sentence-transformers
+    ort = None
+
+ONNX_FILE   = os.getenv("EMBED_ONNX_FILE", "model_int8.onnx")
+MAX_SEQ_LEN = 256   # all-MiniLM-L6-v2's max_seq_length
+
+
+class OnnxEncoder:
+    """Implements the subset of SentenceTransformer.encode that vector_db uses."""
+
+    def __init__(self, model_dir: str):
+        if ort is None:
+            raise RuntimeError("onnxruntime / tokenizers are not installed")
+        self._tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self._tokenizer.enable_truncation(max_length=MAX_SEQ_LEN)
+        self._tokenizer.enable_padding()
+        self._session = ort.InferenceSession(
+            os.path.join(model_dir, ONNX_FILE),
+            providers=["CPUExecutionProvider"],
+        )
+        self._inputs = {i.name for i in self._session.get_inputs()}
+
+    def encode(
+        self,
+        sentences:            Union[str, List[str]],
+        batch_size:           int  = 32,
+        convert_to_numpy:     bool = True,
+        normalize_embeddings: bool = False,
+    ) -> np.ndarray:
+        single = isinstance(sentences, str)
+        texts  = [sentences] if single else list(sentences)
+
+        batches = [self._encode_batch(texts[i:i + batch_size]) for i in range(0, len(texts), batch_size)]
+        vecs    = np.concatenate(batches) if batches else np.empty((0, 0), dtype=np.float32)
+        if normalize_embeddings and len(vecs):
+            vecs /= np.clip(np.linalg.norm(vecs, axis=1, keepdims=True), 1e-12, None)
+        return vecs[0] if single else vecs
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        encoded = self._tokenizer.encode_batch(texts)
+        ids     = np.array([e.ids            for e in encoded], dtype=np.int64)
+        mask    = np.array([e.attention_mask for e in encoded], dtype=np.int64)
+
+        feeds = {"input_ids": ids, "attention_mask": mask}
+        if "token_type_ids" in self._inputs:
+            feeds["token_type_ids"] = np.zeros_like(ids)
+        hidden = self._session.run(None, feeds)[0]          # (batch, seq, dim)
+
+        # Mean pooling over real (unpadded) tokens
+        weights = mask[..., None].astype(np.float32)
+        return (hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None)
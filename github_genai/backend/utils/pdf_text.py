@@ -0,0 +1,153 @@
+# backend/utils/pdf_text.py
+"""
+PDF text extraction for the Upload PDF pipeline.
+
+pypdfium2 (PDFium, range-based text API) is the primary extractor;
+PyMuPDF is the fallback when pypdfium2 is missing or rejects a file.
+Small documents are parsed inline. Longer ones are split into page
+ranges and extracted in parallel by a process pool – each worker reopens
+the PDF itself, since native document handles can't cross processes.
+Sources are PDF bytes or a file path; pass a path for uploads so the
+document is never held in memory whole nor pickled to every worker.
+Pages are streamed into one buffer as they arrive, and callers can be
+handed the leading text early (e.g. to start the AI summary).
+This module imports nothing heavy so spawned workers start fast.
+"""
+
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # optional dependency – PyMuPDF only
+    pdfium = None
+
+logger = logging.getLogger(__name__)
+
+PdfSource = Union[bytes, str]   # raw PDF bytes, or a path on disk
+
+MAX_PAGES   = 50    # extraction cap per upload
+CHUNK_PAGES = 10    # pages per worker task; at or below this, stay inline
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+# PDFium is not thread-safe and sync upload handlers share FastAPI's
+# threadpool – every pdfium call in a process goes through this lock
+# (pool workers each have their own, uncontended)
+_pdfium_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn, not fork – the API process is multi-threaded
+        _pool = ProcessPoolExecutor(
+            max_workers = min(4, os.cpu_count() or 1),
+            mp_context  = multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def extract_pdf_text(
+    contents:   PdfSource,
+    on_head:    Optional[Callable[[str], None]] = None,
+    head_chars: int = 0,
+) -> Tuple[str, int]:
+    """
+    Extract text from PDF bytes or a PDF file path.
+    Returns (full_text, page_count).
+    Falls back to empty string if extraction fails.
+
+    If on_head is given it is called once with the first head_chars
+    characters as soon as they are extracted, while later pages are
+    still being parsed.
+    """
+    try:
+        pages = _page_count(contents)
+        buf   = io.StringIO()
+        size  = 0
+        fired = on_head is None
+        for i, page in enumerate(_iter_pages(contents, min(pages, MAX_PAGES))):
+            if i:
+                buf.write("\n\n")
+                size += 2
+            buf.write(page)
+            size += len(page)
+            if not fired and size >= head_chars:
+                on_head(buf.getvalue()[:head_chars])
+                fired = True
+        return buf.getvalue(), pages
+    except Exception as e:
+        logger.error(f"PDF extraction failed: {e}")
+        return "", 0
+
+
+def _iter_pages(contents: PdfSource, n: int) -> Iterator[str]:
+    """Page texts in order; ranges come back from the pool as they finish."""
+    if n <= CHUNK_PAGES:
+        yield from _extract_range(contents, (0, n))
+        return
+
+    ranges = [(start, min(start + CHUNK_PAGES, n)) for start in range(0, n, CHUNK_PAGES)]
+    for chunk in _get_pool().map(_extract_range, [contents] * len(ranges), ranges):
+        yield from chunk
+
+
+def _page_count(contents: PdfSource) -> int:
+    if pdfium is not None:
+        try:
+            with _pdfium_lock:
+                pdf = pdfium.PdfDocument(contents)
+                try:
+                    return len(pdf)
+                finally:
+                    pdf.close()
+        except Exception as e:
+            logger.warning(f"pypdfium2 could not open PDF, using PyMuPDF: {e}")
+
+    with _fitz_open(contents) as doc:
+        return doc.page_count
+
+
+def _extract_range(contents: PdfSource, page_range: Tuple[int, int]) -> List[str]:
+    """Extract pages [start, stop) – also the process-pool worker task."""
+    start, stop = page_range
+    if pdfium is not None:
+        try:
+            return _pdfium_range(contents, start, stop)
+        except Exception as e:
+            logger.warning(f"pypdfium2 extraction failed, using PyMuPDF: {e}")
+    return _fitz_range(contents, start, stop)
+
+
+def _pdfium_range(contents: PdfSource, start: int, stop: int) -> List[str]:
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(contents)
+        try:
+            parts = []
+            for i in range(start, stop):
+                page     = pdf[i]
+                textpage = page.get_textpage()
+                parts.append(textpage.get_text_range().replace("\r\n", "\n"))
+                textpage.close()
+                page.close()
+            return parts
+        finally:
+            pdf.close()
+
+
+def _fitz_range(contents: PdfSource, start: int, stop: int) -> List[str]:
+    with _fitz_open(contents) as doc:
+        return [doc.load_page(i).get_text("text") for i in range(start, stop)]
+
+
+def _fitz_open(contents: PdfSource):
+    import fitz  # PyMuPDF
+    if isinstance(contents, str):
+        return fitz.open(contents, filetype="pdf")
+    return fitz.open(stream=contents, filetype="pdf")
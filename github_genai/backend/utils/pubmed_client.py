@@ -7,22 +7,70 @@ Set NCBI_API_KEY in .env for 10 req/s instead of 3 req/s.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import itertools
 import logging
 import os
 import re
-import xml.etree.ElementTree as ET
 from typing import Dict, List, Optional
 
 import httpx
 
-from models.schemas import PaperSearchResult
+try:
+    from lxml import etree          # C parser, same find/findall/itertext API
+    _LXML = True
+except ImportError:  # optional dependency – stdlib fallback
+    import xml.etree.ElementTree as etree
+    _LXML = False
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional dependency – stdlib json
+    from json import loads as _json_loads
+
+from models.schemas import PaperSearchResult, PaperSearchResultListAdapter
+from utils.cache    import PUBMED_TTL, cache_get, cache_set
+from utils.tagging  import keyword_tagger
 
 logger       = logging.getLogger(__name__)
 ESEARCH_URL  = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
 EFETCH_URL   = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
 NCBI_API_KEY = os.getenv("NCBI_API_KEY", "")
 TIMEOUT      = 20
+EFETCH_CHUNK = 20   # PMIDs per efetch request when fanning out
+
+_WS_RE = re.compile(r"\s+")
+
+_MONTHS = {"Jan":"01","Feb":"02","Mar":"03","Apr":"04","May":"05","Jun":"06",
+           "Jul":"07","Aug":"08","Sep":"09","Oct":"10","Nov":"11","Dec":"12"}
+
+# Title keyword → tag, matched in one pass by _auto_tags
+_TAG_KEYWORDS = {
+    "cancer": "Oncology", "covid": "Infectious Disease", "mri": "Medical Imaging",
+    "gene": "Genomics", "protein": "Proteomics", "drug": "Pharmacology",
+    "neural": "Neuroscience", "clinical": "Clinical Research",
+    "deep learning": "Deep Learning", "machine learning": "ML",
+}
+_auto_tags = keyword_tagger(_TAG_KEYWORDS)
+
+# Concurrent efetch requests – NCBI allows 10 req/s with a key, 3 without
+_efetch_slots = asyncio.Semaphore(10 if NCBI_API_KEY else 3)
+
+# One pooled client for the process – TLS sessions to eutils are reused
+# across searches (HTTP/2 when the server offers it) instead of a new
+# handshake per esearch/efetch
+_client = httpx.AsyncClient(
+    timeout = TIMEOUT,
+    http2   = True,
+    limits  = httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    headers = {"User-Agent": "AcademiaX/1.0"},
+)
+
+
+async def aclose_client() -> None:
+    """Shutdown hook – closes the pooled connections."""
+    await _client.aclose()
 
 
 async def search_pubmed(query: str, max_results: int = 10) -> List[PaperSearchResult]:
@@ -43,38 +91,79 @@ async def _esearch(query: str, max_results: int) -> List[str]:
     if NCBI_API_KEY:
         params["api_key"] = NCBI_API_KEY
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as c:
-            r = await c.get(ESEARCH_URL, params=params)
-            r.raise_for_status()
-            return r.json().get("esearchresult", {}).get("idlist", [])
+        r = await _client.get(ESEARCH_URL, params=params)
+        r.raise_for_status()
+        return _json_loads(r.content).get("esearchresult", {}).get("idlist", [])
     except Exception as e:
         logger.error(f"PubMed esearch error: {e}")
         return []
 
 
 async def _efetch(pmids: List[str]) -> List[PaperSearchResult]:
+    """
+    Fetch records, splitting large ID lists into concurrent chunks (order
+    kept). Parsed results are cached per ID set, so a repeat fetch skips
+    both the download and the XML parse.
+    """
+    key    = "pubmed:" + hashlib.sha256(",".join(sorted(pmids)).encode()).hexdigest()
+    cached = await asyncio.to_thread(cache_get, key)   # Redis client is blocking
+    if cached is not None:
+        by_id = {r.external_id: r for r in PaperSearchResultListAdapter.validate_json(cached)}
+        return [by_id[p] for p in pmids if p in by_id]
+
+    if len(pmids) <= EFETCH_CHUNK:
+        papers = await _efetch_chunk(pmids)
+    else:
+        chunks = [pmids[i:i + EFETCH_CHUNK] for i in range(0, len(pmids), EFETCH_CHUNK)]
+        parts  = await asyncio.gather(*(_efetch_chunk(c) for c in chunks))
+        papers = list(itertools.chain.from_iterable(parts))
+
+    if papers:   # empty usually means an upstream error – don't pin it
+        await asyncio.to_thread(cache_set, key, PaperSearchResultListAdapter.dump_json(papers), PUBMED_TTL)
+    return papers
+
+
+async def _efetch_chunk(pmids: List[str]) -> List[PaperSearchResult]:
     params: Dict = {"db": "pubmed", "id": ",".join(pmids),
                     "retmode": "xml", "rettype": "abstract"}
     if NCBI_API_KEY:
         params["api_key"] = NCBI_API_KEY
     try:
-        async with httpx.AsyncClient(timeout=TIMEOUT) as c:
-            r = await c.get(EFETCH_URL, params=params)
-            r.raise_for_status()
-            return _parse_xml(r.text)
+        # Parse the body as it downloads: each finished <PubmedArticle> is
+        # turned into a result and dropped, so neither the full response
+        # nor the full DOM is ever held in memory
+        results = []
+        parser  = _article_parser()
+        async with _efetch_slots:
+            async with _client.stream("GET", EFETCH_URL, params=params) as r:
+                r.raise_for_status()
+                async for chunk in r.aiter_bytes():
+                    parser.feed(chunk)
+                    results.extend(_drain_articles(parser))
+        parser.close()
+        results.extend(_drain_articles(parser))
     except Exception as e:
         logger.error(f"PubMed efetch error: {e}")
         return []
 
+    logger.info(f"PubMed: {len(results)} results")
+    return results
 
-def _parse_xml(xml_text: str) -> List[PaperSearchResult]:
-    results = []
-    try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError:
-        return results
 
-    for article in root.findall(".//PubmedArticle"):
+def _article_parser():
+    if _LXML:
+        # No entity resolution / network access – the efetch DOCTYPE stays inert
+        return etree.XMLPullParser(
+            events=("end",), tag="PubmedArticle", resolve_entities=False, no_network=True,
+        )
+    return etree.XMLPullParser(events=("end",))
+
+
+def _drain_articles(parser) -> List[PaperSearchResult]:
+    results = []
+    for _, article in parser.read_events():
+        if article.tag != "PubmedArticle":
+            continue
         try:
             r = _parse_article(article)
             if r:
@@ -82,11 +171,14 @@ def _parse_xml(xml_text: str) -> List[PaperSearchResult]:
         except Exception as e:
             logger.warning(f"Skipping article: {e}")
 
-    logger.info(f"PubMed: {len(results)} results")
+        article.clear()
+        if _LXML:   # also unlink the finished siblings from the root
+            while article.getprevious() is not None:
+                del article.getparent()[0]
     return results
 
 
-def _parse_article(article: ET.Element) -> Optional[PaperSearchResult]:
+def _parse_article(article: etree.Element) -> Optional[PaperSearchResult]:
     pmid_el = article.find(".//PMID")
     pmid    = pmid_el.text.strip() if pmid_el is not None and pmid_el.text else None
     if not pmid:
@@ -122,7 +214,8 @@ def _parse_article(article: ET.Element) -> Optional[PaperSearchResult]:
 
     tags = _auto_tags(title)
 
-    return PaperSearchResult(
+    # Every field is built above with the right type – skip validation
+    return PaperSearchResult.model_construct(
         external_id    = pmid,
         source         = "pubmed",
         title          = _clean(title),
@@ -139,7 +232,7 @@ def _parse_article(article: ET.Element) -> Optional[PaperSearchResult]:
     )
 
 
-def _pubmed_date(article: ET.Element) -> str:
+def _pubmed_date(article: etree.Element) -> str:
     for path in [".//PubDate", ".//ArticleDate",
                  ".//PubMedPubDate[@PubStatus='pubmed']"]:
         d = article.find(path)
@@ -148,26 +241,13 @@ def _pubmed_date(article: ET.Element) -> str:
             month = d.findtext("Month", "01")
             day   = d.findtext("Day",   "01")
             if year:
-                m_map = {"Jan":"01","Feb":"02","Mar":"03","Apr":"04","May":"05","Jun":"06",
-                         "Jul":"07","Aug":"08","Sep":"09","Oct":"10","Nov":"11","Dec":"12"}
-                return f"{year}-{m_map.get(month, month).zfill(2)}-{day.zfill(2)}"
+                return f"{year}-{_MONTHS.get(month, month).zfill(2)}-{day.zfill(2)}"
     return ""
 
 
-def _inner_text(el: Optional[ET.Element]) -> str:
+def _inner_text(el: Optional[etree.Element]) -> str:
     return "".join(el.itertext()) if el is not None else ""
 
 
 def _clean(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
-
-
-def _auto_tags(title: str) -> List[str]:
-    keywords = {
-        "cancer": "Oncology", "covid": "Infectious Disease", "mri": "Medical Imaging",
-        "gene": "Genomics", "protein": "Proteomics", "drug": "Pharmacology",
-        "neural": "Neuroscience", "clinical": "Clinical Research",
-        "deep learning": "Deep Learning", "machine learning": "ML",
-    }
-    low = title.lower()
-    return list({v for k, v in keywords.items() if k in low})[:3]
+    return _WS_RE.sub(" ", text).strip()
@@ -1,21 +1,25 @@
 # backend/utils/security.py
 """
-JWT token creation / verification + bcrypt password hashing.
+JWT token creation / verification + Argon2id password hashing.
 Used by every protected endpoint via Depends(get_current_user).
 """
 
 import os
-from datetime import datetime, timedelta
-from typing import Optional
+import threading
+import time
+from functools import lru_cache
+from typing import Optional, Tuple
 
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+import jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, make_transient_to_detached
 
-from models.database import User, get_db
+from models.database import User, Workspace, get_db
 from models.schemas  import TokenData
 
 load_dotenv()
@@ -23,8 +27,19 @@ load_dotenv()
 SECRET_KEY  = os.getenv("SECRET_KEY",  "change_this_secret_in_production")
 ALGORITHM   = os.getenv("ALGORITHM",   "HS256")
 TOKEN_EXPIRE = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "1440"))  # 24 h
+_EXP_SECONDS = TOKEN_EXPIRE * 60
+USER_TTL     = 5       # seconds an authenticated user row is reused
 
-pwd_context      = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Argon2id for new hashes; bcrypt kept so existing accounts still verify.
+# argon2-cffi releases the GIL while hashing, so the threadpool stays free.
+pwd_context      = CryptContext(
+    schemes              = ["argon2", "bcrypt"],
+    deprecated           = "auto",
+    argon2__type         = "ID",
+    argon2__time_cost    = 2,
+    argon2__memory_cost  = 65536,   # KiB → 64 MB
+    argon2__parallelism  = 1,
+)
 oauth2_scheme    = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
@@ -35,22 +50,71 @@ def hash_password(plain: str) -> str:
 def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
+def verify_and_rehash(plain: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """Verify; also returns a fresh Argon2id hash if `hashed` is bcrypt or uses old cost settings."""
+    return pwd_context.verify_and_update(plain, hashed)
+
 
 # ── JWT helpers ───────────────────────────────────────────────
 def create_access_token(user_id: int) -> str:
-    expire  = datetime.utcnow() + timedelta(minutes=TOKEN_EXPIRE)
-    payload = {"sub": str(user_id), "exp": expire}
+    payload = {"sub": str(user_id), "exp": int(time.time()) + _EXP_SECONDS}
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
 def decode_token(token: str) -> Optional[TokenData]:
+    claims = _verified_claims(token)
+    if claims is None or claims[1] <= time.time():
+        return None
+    return TokenData(user_id=claims[0])
+
+@lru_cache(maxsize=4096)
+def _verified_claims(token: str) -> Optional[Tuple[int, float]]:
+    """(user_id, exp) once the signature checks out. Memoised per token, so
+    expiry is left to decode_token – a cached entry never outlives it."""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = int(payload.get("sub"))
-        return TokenData(user_id=user_id)
-    except (JWTError, TypeError, ValueError):
+        payload = jwt.decode(
+            token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": False},
+        )
+        return int(payload.get("sub")), float(payload["exp"])
+    except (jwt.PyJWTError, KeyError, TypeError, ValueError):
         return None
 
 
+# ── User lookup cache ─────────────────────────────────────────
+# Column snapshots of active users, re-attached to each request's session
+# without a SELECT. Relationships still lazy-load through that session.
+# The cache is per process: ORM writes to a User in this process evict it
+# at once (listeners below); other workers see the change within USER_TTL.
+_users: "TTLCache[int, dict]" = TTLCache(maxsize=4096, ttl=USER_TTL)
+_users_lock = threading.Lock()
+_USER_COLS  = [c.key for c in User.__table__.columns]
+
+def _load_user(db: Session, user_id: int) -> Optional[User]:
+    with _users_lock:
+        cols = _users.get(user_id)
+    if cols is not None:
+        user = User(**cols)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    user = db.query(User).filter(User.id == user_id, User.is_active == True).first()
+    if user:
+        with _users_lock:
+            _users[user_id] = {k: getattr(user, k) for k in _USER_COLS}
+    return user
+
+def forget_user(user_id: int) -> None:
+    """Drop a user's snapshot so the next request re-reads the row."""
+    with _users_lock:
+        _users.pop(user_id, None)
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _evict_user(mapper, connection, target: User) -> None:
+    # Every flushed change – deactivation, password rehash at login, … –
+    # evicts, whether or not the caller remembered forget_user
+    forget_user(target.id)
+
+
 # ── FastAPI dependency ────────────────────────────────────────
 def get_current_user(
     token: str      = Depends(oauth2_scheme),
@@ -65,7 +129,17 @@ def get_current_user(
     if not token_data:
         raise credentials_exc
 
-    user = db.query(User).filter(User.id == token_data.user_id, User.is_active == True).first()
+    user = _load_user(db, token_data.user_id)
     if not user:
         raise credentials_exc
     return user
+
+
+# ── Ownership checks ─────────────────────────────────────────
+def owns_workspace(db: Session, owner_id: int, workspace_id: int) -> bool:
+    """SELECT 1 … LIMIT 1 – no row fetch or ORM hydration for a yes/no check."""
+    return db.execute(
+        select(1)
+        .where(Workspace.id == workspace_id, Workspace.owner_id == owner_id)
+        .limit(1)
+    ).scalar() is not None
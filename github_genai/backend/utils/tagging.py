@@ -0,0 +1,47 @@
+# backend/utils/tagging.py
+"""
+Keyword → topic-tag matching for search results (arXiv, PubMed).
+
+Each keyword table is compiled once into a pyahocorasick automaton, so a
+title is tagged in one linear scan however many keywords there are.
+Without pyahocorasick a single regex alternation does the same job.
+"""
+
+import re
+from typing import Callable, Dict, List
+
+try:
+    import ahocorasick
+except ImportError:  # optional dependency – regex fallback
+    ahocorasick = None
+
+MAX_TAGS = 3
+
+
+def keyword_tagger(keywords: Dict[str, str]) -> Callable[[str], List[str]]:
+    """
+    Build a tagger for {lowercase keyword: tag}. The tagger returns up to
+    MAX_TAGS distinct tags whose keyword occurs anywhere in the text
+    (substring match, case-insensitive), in order of first appearance.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for kw, tag in keywords.items():
+            automaton.add_word(kw, (len(kw), tag))
+        automaton.make_automaton()
+
+        def tag_text(text: str) -> List[str]:
+            # iter() reports matches by end offset – re-sort by start
+            hits = sorted((end - n + 1, tag) for end, (n, tag) in automaton.iter(text.lower()))
+            return list(dict.fromkeys(tag for _, tag in hits))[:MAX_TAGS]
+
+        return tag_text
+
+    # Zero-width lookahead so overlapping keywords still all match
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+
+    def tag_text(text: str) -> List[str]:
+        tags = dict.fromkeys(keywords[m.group(1)] for m in pattern.finditer(text.lower()))
+        return list(tags)[:MAX_TAGS]
+
+    return tag_text
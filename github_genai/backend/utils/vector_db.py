@@ -3,37 +3,82 @@
 Vector Database layer.
 
 Converts paper text → 384-dim sentence-transformer embeddings,
-stores them in PostgreSQL, and performs cosine-similarity search.
-
-Production upgrade path: swap numpy store for pgvector extension.
+stores them as fp16 in a pgvector halfvec column, and performs cosine-similarity search
+inside PostgreSQL via the HNSW index (ORDER BY vector <=> :q LIMIT k),
+falling back to an exact scan of the caller's rows when the shared index
+comes back short after the owner/workspace filter.
 """
 
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 import logging
-from typing import List, Optional, Tuple
+import os
+import struct
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from models.database import Paper, VectorEmbedding, WorkspacePaper
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional dependency – stdlib json
+    from json import loads as _json_loads
+
+from models.database    import EMBEDDING_DIM, Paper, VectorEmbedding, WorkspacePaper
+from utils.cache        import SEARCH_TTL, bust_search, cache_get, cache_set, search_version
+from utils.onnx_encoder import OnnxEncoder
 
 logger     = logging.getLogger(__name__)
 MODEL_NAME = "all-MiniLM-L6-v2"    # 384-dim, ~80 MB, fast inference
-_model: Optional[SentenceTransformer] = None
+EF_SEARCH  = 40                    # HNSW candidate list size per query
+# The HNSW index is shared by all users, so an owner/workspace filter is
+# applied to its candidates and can leave fewer than top_k rows. By default
+# that is handled by _nearest's exact-scan fallback, which works on any
+# pgvector. On pgvector >= 0.8 (older servers reject the setting) set
+# strict_order / relaxed_order so the index keeps walking the graph until
+# top_k rows pass – the fallback then only runs when the user truly has
+# fewer matching papers.
+_ITERATIVE_SCANS = {"", "off", "strict_order", "relaxed_order"}
+ITERATIVE_SCAN   = os.getenv("HNSW_ITERATIVE_SCAN", "").strip().lower()
+if ITERATIVE_SCAN not in _ITERATIVE_SCANS:
+    logger.warning(f"Ignoring invalid HNSW_ITERATIVE_SCAN={ITERATIVE_SCAN!r}")
+if ITERATIVE_SCAN not in _ITERATIVE_SCANS or ITERATIVE_SCAN == "off":
+    ITERATIVE_SCAN = ""             # "off" is the server default – no SET needed
+BATCH_SIZE = 64                    # sentences per encode() forward pass
+ONNX_DIR   = os.getenv("EMBED_ONNX_DIR")   # exported MiniLM – see utils/onnx_encoder.py
+_model: Optional[Union[SentenceTransformer, OnnxEncoder]] = None
+_embed_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="embed")
 
 
 # ── Load model (singleton) ────────────────────────────────────
-def _get_model() -> SentenceTransformer:
+def _get_model() -> Union[SentenceTransformer, OnnxEncoder]:
     global _model
     if _model is None:
+        if ONNX_DIR:
+            try:
+                logger.info(f"Loading ONNX encoder: {ONNX_DIR}")
+                _model = OnnxEncoder(ONNX_DIR)
+                return _model
+            except Exception as e:
+                logger.warning(f"ONNX encoder unavailable, using sentence-transformers: {e}")
         logger.info(f"Loading sentence-transformer: {MODEL_NAME}")
         _model = SentenceTransformer(MODEL_NAME)
     return _model
 
 
+def warm_model() -> None:
+    """Load the model and run one forward pass (called at app startup)."""
+    embed_text("warm-up")
+
+
 # ═════════════════════════════════════════════════════════════
 # EMBEDDING HELPERS
 # ═════════════════════════════════════════════════════════════
@@ -44,25 +89,49 @@ def embed_text(text: str) -> np.ndarray:
     return vec.astype(np.float32)
 
 
+@lru_cache(maxsize=4096)
+def embed_query(text: str) -> np.ndarray:
+    """
+    Cached embed_text for search queries – repeated questions and
+    re-run searches skip the model entirely. Returned arrays are shared,
+    so they are marked read-only.
+    """
+    vec = embed_text(text)
+    vec.flags.writeable = False
+    return vec
+
+
+def embed_text_async(text: str) -> Future:
+    """Start embed_query on a worker thread so the caller can overlap DB I/O."""
+    return _embed_pool.submit(embed_query, text)
+
+
+def embed_texts(texts: List[str]) -> np.ndarray:
+    """Batch variant of embed_text – one (n, 384) matrix for n texts."""
+    vecs = _get_model().encode(
+        texts,
+        batch_size           = BATCH_SIZE,
+        convert_to_numpy     = True,
+        normalize_embeddings = True,
+    )
+    return vecs.astype(np.float32)
+
+
 def _paper_to_text(paper: Paper) -> str:
     parts = [paper.title or ""]
     if paper.abstract:
         parts.append(paper.abstract)
     if paper.authors:
-        try:
-            authors = json.loads(paper.authors)
-            parts.append("Authors: " + ", ".join(authors))
-        except Exception:
-            parts.append(paper.authors)
+        parts.append("Authors: " + ", ".join(paper.authors))
     return " ".join(parts)
 
 
-def _vec_to_str(v: np.ndarray) -> str:
-    return ",".join(str(x) for x in v.tolist())
-
-
-def _str_to_vec(s: str) -> np.ndarray:
-    return np.array(s.split(","), dtype=np.float32)
+def _set_ef_search(db: Session) -> None:
+    """Scope the HNSW search settings to the current transaction."""
+    sql = f"SET LOCAL hnsw.ef_search = {EF_SEARCH}"
+    if ITERATIVE_SCAN:
+        sql += f"; SET LOCAL hnsw.iterative_scan = {ITERATIVE_SCAN}"
+    db.execute(text(sql))
 
 
 # ═════════════════════════════════════════════════════════════
@@ -78,24 +147,86 @@ def create_embedding(db: Session, paper: Paper) -> VectorEmbedding:
     existing = db.query(VectorEmbedding).filter_by(paper_id=paper.id).first()
 
     if existing:
-        existing.vector     = _vec_to_str(vector)
+        existing.vector     = vector
         existing.model_name = MODEL_NAME
         db.commit()
+        bust_search(paper.owner_id)
         db.refresh(existing)
         return existing
 
     emb = VectorEmbedding(
         paper_id   = paper.id,
-        vector     = _vec_to_str(vector),
+        vector     = vector,
         model_name = MODEL_NAME,
     )
     db.add(emb)
     db.commit()
+    bust_search(paper.owner_id)
     db.refresh(emb)
     logger.info(f"Embedding created for paper_id={paper.id}")
     return emb
 
 
+# ── Bulk path: binary COPY ────────────────────────────────────
+_PGCOPY_HEADER  = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_PGCOPY_TRAILER = struct.pack("!h", -1)
+_PG_EPOCH       = datetime(2000, 1, 1)
+_COPY_SQL       = (
+    "COPY vector_embeddings (paper_id, vector, model_name, created_at) "
+    "FROM STDIN WITH (FORMAT BINARY)"
+)
+
+
+def create_embeddings_bulk(db: Session, papers: List[Paper]) -> int:
+    """
+    Embed many freshly inserted papers in one encode() call and stream
+    the vectors into vector_embeddings with a single binary COPY.
+
+    Papers must already be flushed (they need ids) and must not have an
+    embedding yet. Runs on the session's own connection, so the rows
+    join the caller's transaction – the caller commits, then calls
+    bust_search for the owners.
+    """
+    if not papers:
+        return 0
+
+    vectors = embed_texts([_paper_to_text(p) for p in papers])
+    buf     = _pgcopy_payload([p.id for p in papers], vectors)
+
+    cur = db.connection().connection.cursor()
+    try:
+        cur.copy_expert(_COPY_SQL, buf)
+    finally:
+        cur.close()
+
+    logger.info(f"Embeddings copied for {len(papers)} papers")
+    return len(papers)
+
+
+def _pgcopy_payload(paper_ids: List[int], vectors: np.ndarray) -> io.BytesIO:
+    """
+    Hand-encode the PostgreSQL binary COPY format: 11-byte signature,
+    flags + extension length, one tuple per row, then the -1 trailer.
+    A halfvec value is int16 dim, int16 unused, dim × big-endian float2.
+    """
+    model   = MODEL_NAME.encode()
+    now_us  = (datetime.utcnow() - _PG_EPOCH) // timedelta(microseconds=1)
+    vec_hdr = struct.pack("!hh", EMBEDDING_DIM, 0)
+    vec_len = len(vec_hdr) + 2 * EMBEDDING_DIM
+    be_vecs = vectors.astype(">f2")
+
+    buf = io.BytesIO()
+    buf.write(_PGCOPY_HEADER)
+    for paper_id, vec in zip(paper_ids, be_vecs):
+        buf.write(struct.pack("!hii", 4, 4, paper_id))
+        buf.write(struct.pack("!i", vec_len) + vec_hdr + vec.tobytes())
+        buf.write(struct.pack("!i", len(model)) + model)
+        buf.write(struct.pack("!iq", 8, now_us))
+    buf.write(_PGCOPY_TRAILER)
+    buf.seek(0)
+    return buf
+
+
 # ═════════════════════════════════════════════════════════════
 # SEARCH FUNCTIONS
 # ═════════════════════════════════════════════════════════════
@@ -110,28 +241,15 @@ def semantic_search(
     """
     Cosine-similarity search over ALL papers owned by a user.
     Returns list of (Paper, similarity_score) sorted descending.
+    Hit lists are cached per user until their embeddings change.
     """
-    q_vec = embed_text(query)
-
-    rows = (
-        db.query(VectorEmbedding, Paper)
-        .join(Paper, VectorEmbedding.paper_id == Paper.id)
-        .filter(Paper.owner_id == owner_id)
-        .all()
-    )
-    if not rows:
-        return []
+    key  = _search_key(owner_id, "q", query, top_k)
+    hits = _cached_hits(db, key)
+    if hits is None:
+        hits = _nearest(db, embed_query(query), top_k, Paper.owner_id == owner_id)
+        _store_hits(key, hits)
 
-    matrix = np.stack([_str_to_vec(r.VectorEmbedding.vector) for r in rows])
-    papers = [r.Paper for r in rows]
-    scores = matrix @ q_vec                  # cosine (vectors normalised)
-    ranked = np.argsort(scores)[::-1]
-
-    return [
-        (papers[i], float(scores[i]))
-        for i in ranked[:top_k]
-        if float(scores[i]) >= threshold
-    ]
+    return [(paper, score) for paper, score in hits if score >= threshold]
 
 
 def workspace_semantic_search(
@@ -140,32 +258,21 @@ def workspace_semantic_search(
     workspace_id: int,
     owner_id:     int,
     top_k:        int = 5,
+    q_vec:        Optional[np.ndarray] = None,
 ) -> List[Tuple[Paper, float]]:
     """
     Semantic search scoped to a single workspace.
     Used by the AI chatbot to fetch relevant paper context.
+    Pass q_vec when the query was already embedded (see embed_text_async).
     """
-    q_vec = embed_text(query)
-
-    rows = (
-        db.query(VectorEmbedding, Paper)
-        .join(Paper,          VectorEmbedding.paper_id == Paper.id)
-        .join(WorkspacePaper, WorkspacePaper.paper_id  == Paper.id)
-        .filter(
-            WorkspacePaper.workspace_id == workspace_id,
-            Paper.owner_id == owner_id,
-        )
-        .all()
+    if q_vec is None:
+        q_vec = embed_query(query)
+    return _nearest(
+        db, q_vec, top_k,
+        WorkspacePaper.workspace_id == workspace_id,
+        Paper.owner_id == owner_id,
+        workspace = True,
     )
-    if not rows:
-        return []
-
-    matrix = np.stack([_str_to_vec(r.VectorEmbedding.vector) for r in rows])
-    papers = [r.Paper for r in rows]
-    scores = matrix @ q_vec
-    ranked = np.argsort(scores)[::-1]
-
-    return [(papers[i], float(scores[i])) for i in ranked[:top_k]]
 
 
 def get_related_papers(
@@ -175,24 +282,80 @@ def get_related_papers(
     top_k:    int = 5,
 ) -> List[Tuple[Paper, float]]:
     """Find papers most similar to a given paper (Related Papers feature)."""
+    key  = _search_key(owner_id, "rel", paper_id, top_k)
+    hits = _cached_hits(db, key)
+    if hits is not None:
+        return hits
+
     src = db.query(VectorEmbedding).filter_by(paper_id=paper_id).first()
     if not src:
         return []
 
-    src_vec = _str_to_vec(src.vector)
-
-    rows = (
-        db.query(VectorEmbedding, Paper)
-        .join(Paper, VectorEmbedding.paper_id == Paper.id)
-        .filter(Paper.owner_id == owner_id, VectorEmbedding.paper_id != paper_id)
-        .all()
+    hits = _nearest(
+        db, src.vector, top_k,
+        Paper.owner_id == owner_id,
+        VectorEmbedding.paper_id != paper_id,
     )
-    if not rows:
+    _store_hits(key, hits)
+    return hits
+
+
+def _nearest(db: Session, q_vec, top_k: int, *filters, workspace: bool = False) -> List[Tuple[Paper, float]]:
+    """
+    The top_k papers passing `filters`, nearest to q_vec first. The HNSW
+    index is shared by all users and filters are applied to its ef_search
+    candidates, so a user holding a small share of the rows can get fewer
+    than top_k back – then the ranking is redone exactly over just the
+    filtered rows. (workspace=True joins workspace_papers for the filters.)
+    """
+    def scoped(q):
+        q = q.join(VectorEmbedding, VectorEmbedding.paper_id == Paper.id)
+        if workspace:
+            q = q.join(WorkspacePaper, WorkspacePaper.paper_id == Paper.id)
+        return q.filter(*filters)
+
+    distance = VectorEmbedding.vector.cosine_distance(q_vec).label("distance")
+
+    _set_ef_search(db)
+    rows = scoped(db.query(Paper, distance)).order_by(distance).limit(top_k).all()
+
+    if len(rows) < top_k:
+        # MATERIALIZED fences the filter off from the ORDER BY, so the
+        # planner can't answer it from the index – an exact scan of the
+        # user's own rows
+        cand = (
+            scoped(db.query(Paper.id.label("paper_id"), distance))
+            .cte("candidates")
+            .prefix_with("MATERIALIZED")
+        )
+        rows = (
+            db.query(Paper, cand.c.distance)
+            .join(cand, cand.c.paper_id == Paper.id)
+            .order_by(cand.c.distance)
+            .limit(top_k)
+            .all()
+        )
+
+    return [(paper, 1.0 - float(dist)) for paper, dist in rows]
+
+
+# ── Result cache ──────────────────────────────────────────────
+def _search_key(owner_id: int, kind: str, subject, top_k: int) -> str:
+    digest = hashlib.sha256(f"{kind}|{top_k}|{subject}".encode()).hexdigest()
+    return f"vs:{owner_id}:{search_version(owner_id)}:{digest}"
+
+
+def _cached_hits(db: Session, key: str) -> Optional[List[Tuple[Paper, float]]]:
+    """Cached [(paper_id, score)] rehydrated with one primary-key IN query."""
+    raw = cache_get(key)
+    if raw is None:
+        return None
+    ids_scores = _json_loads(raw)
+    if not ids_scores:
         return []
+    papers = {p.id: p for p in db.query(Paper).filter(Paper.id.in_([i for i, _ in ids_scores]))}
+    return [(papers[i], score) for i, score in ids_scores if i in papers]
 
-    matrix = np.stack([_str_to_vec(r.VectorEmbedding.vector) for r in rows])
-    papers = [r.Paper for r in rows]
-    scores = matrix @ src_vec
-    ranked = np.argsort(scores)[::-1]
 
-    return [(papers[i], float(scores[i])) for i in ranked[:top_k]]
+def _store_hits(key: str, hits: List[Tuple[Paper, float]]) -> None:
+    cache_set(key, json.dumps([[p.id, score] for p, score in hits]).encode(), SEARCH_TTL)